@@ -0,0 +1,37 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Sierra Event Bus - compiled dispatch loop
+
+Optional Cython counterpart of event_bus._dispatcher_factory. Build in
+place with ``cythonize -i src/_bus_dispatch.pyx``; event_bus falls back
+to its generated pure-Python dispatchers when this is not compiled.
+"""
+
+from cpython.tuple cimport PyTuple_GET_ITEM, PyTuple_GET_SIZE
+
+
+cdef class Dispatcher:
+    """Call every callback for an event, isolating each with try/except"""
+
+    cdef tuple callbacks
+    cdef object on_error
+
+    def __cinit__(self, tuple callbacks, object on_error):
+        self.callbacks = callbacks
+        self.on_error = on_error
+
+    def __call__(self, object event):
+        cdef Py_ssize_t i
+        cdef Py_ssize_t n = PyTuple_GET_SIZE(self.callbacks)
+        cdef object callback
+        for i in range(n):
+            callback = <object>PyTuple_GET_ITEM(self.callbacks, i)
+            try:
+                callback(event)
+            except Exception as exc:
+                self.on_error(i, exc)
+
+
+def make_dispatcher(tuple callbacks, object on_error):
+    """Same contract as the makers returned by event_bus._dispatcher_factory"""
+    return Dispatcher(callbacks, on_error)
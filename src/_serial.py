@@ -0,0 +1,41 @@
+"""
+SafeHaven AI - resource serialization helpers
+
+The list/dict glue around Pydantic's model_dump for resource payloads.
+Statically typed so it compiles with mypyc (``mypyc src/_serial.py``);
+runs unchanged as plain Python when not compiled.
+"""
+
+from typing import Any, Dict, List
+
+from .resources import Resource
+
+
+def dump_resources(resources: List[Resource]) -> List[Dict[str, Any]]:
+    """JSON-ready dicts for a list of resources"""
+    return [resource.model_dump(mode="json") for resource in resources]
+
+
+def crisis_envelope(resources: List[Resource], emergency_card: str) -> Dict[str, Any]:
+    """Body of /api/resources/crisis"""
+    return {
+        "resources": dump_resources(resources),
+        "emergency_card": emergency_card
+    }
+
+
+def search_envelope(query: str, results: List[Resource]) -> Dict[str, Any]:
+    """Body of /api/resources/search"""
+    return {
+        "query": query,
+        "results": dump_resources(results),
+        "count": len(results)
+    }
+
+
+def crisis_resources_frame(resources: List[Resource], message_type: str) -> Dict[str, Any]:
+    """WebSocket message carrying crisis resources"""
+    return {
+        "type": message_type,
+        "resources": dump_resources(resources)
+    }
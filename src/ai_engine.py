@@ -3,12 +3,17 @@ Core AI Conversation Engine
 Trauma-informed, empathetic AI support for domestic violence survivors
 """
 
-from typing import List, Dict, Optional, Any
+from typing import AsyncIterator, Callable, Iterator, List, Dict, Optional, Any, Union
 from enum import Enum
+import asyncio
 import json
+import logging
+import threading
 from datetime import datetime
 from .config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class ConversationMode(Enum):
     """Different conversation modes based on user needs"""
@@ -20,16 +25,105 @@ class ConversationMode(Enum):
     EVIDENCE_GUIDANCE = "evidence_guidance"
 
 
+MODELS = {
+    "anthropic": "claude-3-5-sonnet-20241022",
+    "openai": "gpt-4-turbo-preview",
+}
+
+# Clients created with the configured keys, one per provider, shared by every
+# engine so sessions reuse a single HTTP connection pool
+_shared_clients: Dict[str, Any] = {}
+
+
+def create_client(provider: str, api_key: Optional[str] = None) -> Optional[Any]:
+    """Create an API client for a provider (None if unavailable)"""
+    if provider == "anthropic":
+        try:
+            from anthropic import Anthropic
+            return Anthropic(api_key=api_key or settings.anthropic_api_key)
+        except ImportError:
+            print("Anthropic library not available. Install with: pip install anthropic")
+    elif provider == "openai":
+        try:
+            from openai import OpenAI
+            return OpenAI(api_key=api_key or settings.openai_api_key)
+        except ImportError:
+            print("OpenAI library not available. Install with: pip install openai")
+    return None
+
+
+def get_shared_client(provider: str) -> Optional[Any]:
+    """The process-wide client for a provider, created on first use"""
+    if provider not in _shared_clients:
+        _shared_clients[provider] = create_client(provider)
+    return _shared_clients[provider]
+
+
+async def _iterate_in_thread(produce: Callable[[], Iterator[str]]) -> AsyncIterator[str]:
+    """
+    Drive a blocking iterator in the default executor and yield its items
+
+    The provider SDK clients are synchronous; pulling their streams on a
+    worker thread keeps the event loop free between chunks. If the consumer
+    stops early (disconnect, cancellation) the worker closes the provider
+    stream at its next item instead of reading it to the end.
+    """
+    loop = asyncio.get_running_loop()
+    items: asyncio.Queue = asyncio.Queue()
+    done = object()
+    stop = threading.Event()
+
+    def post(item: Any) -> None:
+        if not stop.is_set():
+            loop.call_soon_threadsafe(items.put_nowait, item)
+
+    def run() -> None:
+        iterator = produce()
+        try:
+            for item in iterator:
+                if stop.is_set():
+                    break
+                post(item)
+        except Exception as e:
+            post(e)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            post(done)
+
+    loop.run_in_executor(None, run)
+    try:
+        while True:
+            item = await items.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
 class SafeHavenAI:
     """Main AI conversation engine with trauma-informed responses"""
 
-    def __init__(self, api_key: Optional[str] = None, provider: str = "anthropic"):
+    # Built once and shared; the prompts are static
+    _system_prompts: Optional[Dict[ConversationMode, str]] = None
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        provider: str = "anthropic",
+        client: Optional[Any] = None
+    ):
         """
         Initialize the AI engine
 
         Args:
-            api_key: API key for the AI provider
+            api_key: API key for the AI provider (gets a dedicated client)
             provider: 'anthropic' or 'openai'
+            client: Existing API client to use; defaults to the shared client
         """
         self.provider = provider
         self.conversation_history: List[Dict[str, str]] = []
@@ -37,27 +131,15 @@ class SafeHavenAI:
         self.user_name: Optional[str] = None
 
         # Initialize AI client
-        if provider == "anthropic":
-            try:
-                from anthropic import Anthropic
-                self.client = Anthropic(api_key=api_key or settings.anthropic_api_key)
-                self.model = "claude-3-5-sonnet-20241022"
-            except ImportError:
-                self.client = None
-                print("Anthropic library not available. Install with: pip install anthropic")
-        elif provider == "openai":
-            try:
-                from openai import OpenAI
-                self.client = OpenAI(api_key=api_key or settings.openai_api_key)
-                self.model = "gpt-4-turbo-preview"
-            except ImportError:
-                self.client = None
-                print("OpenAI library not available. Install with: pip install openai")
-        else:
-            self.client = None
+        if client is None:
+            client = create_client(provider, api_key) if api_key else get_shared_client(provider)
+        self.client = client
+        self.model = MODELS.get(provider)
 
         # System prompts for different modes
-        self.system_prompts = self._initialize_system_prompts()
+        if SafeHavenAI._system_prompts is None:
+            SafeHavenAI._system_prompts = self._initialize_system_prompts()
+        self.system_prompts = SafeHavenAI._system_prompts
 
     def _initialize_system_prompts(self) -> Dict[ConversationMode, str]:
         """Initialize trauma-informed system prompts for different modes"""
@@ -369,6 +451,113 @@ Never put themselves at risk to document abuse.
             "timestamp": datetime.now().isoformat()
         }
 
+    async def get_response_stream(
+        self, user_message: str, force_mode: Optional[ConversationMode] = None
+    ) -> AsyncIterator[Union[str, Dict[str, Any]]]:
+        """
+        Stream an AI response as the provider generates it
+
+        Yields response text chunks as they arrive, then one final dict with
+        the same fields as get_response() plus "truncated", set when the
+        provider failed after part of the reply was already yielded. Without
+        an API client the fallback response is yielded as a single chunk.
+        """
+        mode = force_mode or self.detect_mode(user_message)
+        self.current_mode = mode
+        system_prompt = self.system_prompts[mode]
+
+        if settings.store_conversations:
+            self.conversation_history.append({
+                "role": "user",
+                "content": user_message,
+                "timestamp": datetime.now().isoformat()
+            })
+
+        if self.client and self.provider == "anthropic":
+            produce = lambda: self._stream_anthropic_response(system_prompt, user_message)
+        elif self.client and self.provider == "openai":
+            produce = lambda: self._stream_openai_response(system_prompt, user_message)
+        else:
+            produce = None
+
+        parts: List[str] = []
+        truncated = False
+        if produce is not None:
+            try:
+                async for chunk in _iterate_in_thread(produce):
+                    parts.append(chunk)
+                    yield chunk
+            except Exception:
+                # Text already sent stays; the final dict flags it as incomplete
+                truncated = bool(parts)
+                logger.exception(
+                    "Error streaming %s response%s", self.provider,
+                    " (reply truncated)" if truncated else ""
+                )
+        if not parts:
+            fallback = self._get_fallback_response(mode)
+            parts.append(fallback)
+            yield fallback
+        response_text = "".join(parts)
+
+        if settings.store_conversations:
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": response_text,
+                "timestamp": datetime.now().isoformat()
+            })
+
+        yield {
+            "response": response_text,
+            "mode": mode.value,
+            "is_crisis": mode == ConversationMode.CRISIS,
+            "emergency_resources": self._get_emergency_resources() if mode == ConversationMode.CRISIS else None,
+            "safety_reminder": self._get_safety_reminder(),
+            "timestamp": datetime.now().isoformat(),
+            "truncated": truncated
+        }
+
+    def _stream_anthropic_response(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """Yield text deltas from Anthropic Claude (blocking; run off the event loop)"""
+        messages = [
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in self.conversation_history[-10:]
+            if msg["role"] in ["user", "assistant"]
+        ]
+        messages.append({"role": "user", "content": user_message})
+
+        events = self.client.messages.create(
+            model=self.model,
+            max_tokens=1024,
+            system=system_prompt,
+            messages=messages,
+            stream=True
+        )
+        for event in events:
+            if event.type == "content_block_delta" and getattr(event.delta, "text", None):
+                yield event.delta.text
+
+    def _stream_openai_response(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """Yield text deltas from OpenAI GPT (blocking; run off the event loop)"""
+        messages = [{"role": "system", "content": system_prompt}]
+        messages.extend(
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in self.conversation_history[-10:]
+            if msg["role"] in ["user", "assistant"]
+        )
+        messages.append({"role": "user", "content": user_message})
+
+        chunks = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=1024,
+            temperature=0.7,
+            stream=True
+        )
+        for chunk in chunks:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     async def _get_anthropic_response(self, system_prompt: str, user_message: str) -> str:
         """Get response from Anthropic Claude"""
         try:
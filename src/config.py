@@ -1,7 +1,7 @@
 """Configuration management for SafeHaven AI"""
 
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -24,8 +24,12 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./safehaven.db"
 
+    # Multi-worker session routing (optional; e.g. redis://localhost:6379/0)
+    redis_url: Optional[str] = None
+
     # Security
     session_expire_minutes: int = 60
+    allowed_origins: List[str] = ["http://127.0.0.1:8000", "http://localhost:8000"]
     encryption_key: Optional[str] = None
 
     # Privacy Settings
@@ -6,12 +6,39 @@ This module gives Sierra deep emotional understanding and the ability
 to connect with survivors on a profound level.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property, lru_cache
 import re
 from datetime import datetime
+import heapq
 import math
+import operator
+import random
+
+# Optional Rust Aho-Corasick automaton for literal keyword matching
+try:
+    import ahocorasick_rs
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+@lru_cache(maxsize=1)
+def _arrow_modules() -> Optional[Tuple[Any, Any, Any]]:
+    """
+    Optional vectorized backend for batch analysis: (numpy, pyarrow,
+    pyarrow.compute), or None if not installed. Imported on first batch call
+    since pyarrow is slow to import and single-message analysis never uses it.
+    """
+    try:
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+    return np, pa, pc
 
 
 class EmotionType(Enum):
@@ -45,13 +72,13 @@ class TraumaIndicator(Enum):
     FLIGHT_RESPONSE = "flight_response"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmotionalState:
-    """Represents detected emotional state"""
+    """Represents detected emotional state (immutable - analyses are cached and shared)"""
     primary_emotion: EmotionType
-    secondary_emotions: List[EmotionType]
+    secondary_emotions: Tuple[EmotionType, ...]
     intensity: float  # 0.0 - 1.0
-    trauma_indicators: List[TraumaIndicator]
+    trauma_indicators: Tuple[TraumaIndicator, ...]
     crisis_level: int  # 0-10
     needs_affirmation: bool
     needs_grounding: bool
@@ -59,7 +86,7 @@ class EmotionalState:
     confidence: float  # Detection confidence
 
 
-@dataclass
+@dataclass(slots=True)
 class EmpathyResponse:
     """Sierra's empathetic response"""
     validation: str  # Validates their feelings
@@ -70,6 +97,297 @@ class EmpathyResponse:
     empathy_score: float  # This response's empathy rating
 
 
+@lru_cache(maxsize=1)
+def _build_emotion_patterns() -> Dict[EmotionType, List[str]]:
+    """Build comprehensive emotion detection patterns"""
+    return {
+        EmotionType.FEAR: [
+            r'\bscared\b', r'\bafraid\b', r'\bterrified\b', r'\bfrightened\b',
+            r'\bworried\b', r'\bnervous\b', r'\bpanic', r'\bdread', r'\bfear',
+            r"what if he", r"what if she", r"i'm afraid", r"makes me scared"
+        ],
+        EmotionType.SADNESS: [
+            r'\bsad\b', r'\bdepressed\b', r'\bunhappy\b', r'\bmiserable\b',
+            r'\bhurt(?:ing)?\b', r'\bheartbr', r'\bcry(?:ing)?\b', r'\btears\b',
+            r'\bdown\b', r'\bupset\b', r"can't stop crying", r"feel empty"
+        ],
+        EmotionType.ANGER: [
+            r'\bangry\b', r'\bmad\b', r'\bfurious\b', r'\benraged\b',
+            r'\bpissed\b', r'\bfrustrat', r'\bhate\b', r'\bresentment\b',
+            r"so angry", r"makes me mad", r"i hate", r"fucking"
+        ],
+        EmotionType.SHAME: [
+            r'\bashamed\b', r'\bembarrass', r'\bhumiliat', r'\bpathetic\b',
+            r'\bworthless\b', r'\bdisgusting\b', r"my fault", r"i deserve",
+            r"so stupid", r"what's wrong with me", r"i'm nothing"
+        ],
+        EmotionType.GUILT: [
+            r'\bguilty\b', r'\bguilt\b', r'\bblame myself\b', r'\bmy fault\b',
+            r"should have", r"shouldn't have", r"if only i", r"i caused"
+        ],
+        EmotionType.CONFUSION: [
+            r"\bconfused\b", r"\bdon't understand\b", r"\bwhy\b", r"\bmixed feelings\b",
+            r"don't know", r"can't tell", r"makes no sense", r"contradicting"
+        ],
+        EmotionType.HOPE: [
+            r'\bhope\b', r'\bmaybe\b', r'\bcould be better\b', r'\bwant to\b',
+            r"things might", r"hoping", r"possibly", r"dream of"
+        ],
+        EmotionType.LONELINESS: [
+            r'\balone\b', r'\blonely\b', r'\bisolated\b', r'\bno one\b',
+            r"by myself", r"nobody understands", r"all alone", r"isolated"
+        ],
+        EmotionType.OVERWHELM: [
+            r'\boverwhelm', r'\btoo much\b', r"\bcan't handle\b", r"\bcan't cope\b",
+            r"drowning", r"can't breathe", r"crumbling", r"falling apart"
+        ],
+        EmotionType.NUMBNESS: [
+            r'\bnumb\b', r'\bnothing\b', r"\bdon't feel\b", r'\bempty\b',
+            r"feel nothing", r"can't feel", r"shut down", r"detached"
+        ],
+        EmotionType.ANXIETY: [
+            r'\banxious\b', r'\banxiety\b', r'\bstress', r'\btense\b',
+            r"can't relax", r"on edge", r"constantly worried", r"racing thoughts"
+        ],
+        EmotionType.DESPAIR: [
+            r'\bhopeless\b', r'\bdespair\b', r'\bgive up\b', r'\bno point\b',
+            r"can't go on", r"no way out", r"never get better", r"pointless"
+        ]
+    }
+
+
+@lru_cache(maxsize=1)
+def _build_trauma_patterns() -> Dict[TraumaIndicator, List[str]]:
+    """Build trauma response detection patterns"""
+    return {
+        TraumaIndicator.HYPERVIGILANCE: [
+            r"always watching", r"on guard", r"waiting for", r"checking",
+            r"can't relax", r"constantly aware", r"monitoring"
+        ],
+        TraumaIndicator.DISSOCIATION: [
+            r"out of body", r"watching myself", r"not real", r"floating",
+            r"disconnected", r"numb", r"autopilot", r"foggy"
+        ],
+        TraumaIndicator.FLASHBACK: [
+            r"keep seeing", r"reliving", r"back there", r"happening again",
+            r"can't stop seeing", r"playing over"
+        ],
+        TraumaIndicator.TRIGGER: [
+            r"reminds me", r"brings back", r"sets me off", r"makes me think of",
+            r"triggered", r"brought it all back"
+        ],
+        TraumaIndicator.FREEZE_RESPONSE: [
+            r"can't move", r"frozen", r"paralyzed", r"stuck",
+            r"couldn't do anything", r"just stood there"
+        ],
+        TraumaIndicator.FAWN_RESPONSE: [
+            r"tried to please", r"make them happy", r"keep the peace",
+            r"avoid conflict", r"be perfect", r"not upset them"
+        ]
+    }
+
+
+@lru_cache(maxsize=1)
+def _build_affirmation_library() -> List[str]:
+    """Build library of affirmations organized by need"""
+    return [
+        # Core worth affirmations
+        "You are inherently valuable, just as you are.",
+        "Your worth is not determined by anyone else's treatment of you.",
+        "You deserve love, safety, and respect - always.",
+        "You are enough, exactly as you are in this moment.",
+
+        # Strength affirmations
+        "The fact that you're here, talking about this - that's incredible strength.",
+        "Surviving takes tremendous courage, and you're doing it.",
+        "You're stronger than you know, and braver than you feel.",
+        "Every day you get through is a testament to your resilience.",
+
+        # Choice affirmations
+        "You have the right to make your own choices, in your own time.",
+        "Whatever you decide, your autonomy matters.",
+        "You know your situation better than anyone else.",
+        "There's no wrong choice when you're doing what you need to survive.",
+
+        # Feeling validation
+        "All of your feelings are valid - every single one.",
+        "It's okay to feel multiple, contradicting emotions at once.",
+        "You're allowed to feel however you feel, without judgment.",
+        "Your feelings make sense given what you've experienced.",
+
+        # Hope affirmations
+        "Healing is possible, even when it doesn't feel like it.",
+        "You deserve a life filled with peace and joy.",
+        "Better days are possible, and you deserve them.",
+        "Your story doesn't end here - there's so much more ahead.",
+
+        # Not alone
+        "You are not alone in this, even when it feels that way.",
+        "What you're experiencing is not your fault.",
+        "Many people have walked this path and found their way to safety.",
+        "You deserve support, and it's available to you.",
+
+        # Self-compassion
+        "Be gentle with yourself - you're doing the best you can.",
+        "You deserve the same compassion you'd give to someone you love.",
+        "It's okay to take things one moment at a time.",
+        "You don't have to have all the answers right now."
+    ]
+
+
+@lru_cache(maxsize=1)
+def _build_love_statements() -> Dict[str, List[str]]:
+    """
+    Build love-centered statements
+    Core Mission: "How can we help you love yourself more?"
+    """
+    return {
+        "unconditional_love": [
+            "You are deeply worthy of love - not because of what you do, but because of who you are.",
+            "Love is your birthright. You don't have to earn it.",
+            "You deserve to be loved in a way that feels safe, gentle, and affirming.",
+            "The love you deserve doesn't come with fear, control, or conditions.",
+        ],
+        "self_love_invitation": [
+            "What if we could help you see yourself the way you deserve to be seen - with love and compassion?",
+            "You're learning to love yourself, and that's one of the bravest journeys.",
+            "Loving yourself isn't selfish - it's essential. You deserve your own kindness.",
+            "What would it feel like to treat yourself with the gentleness you'd give someone you love?",
+        ],
+        "love_in_action": [
+            "Choosing your safety is an act of self-love.",
+            "Setting boundaries is loving yourself.",
+            "Taking time to heal is how you love yourself forward.",
+            "Every step you take toward peace is you loving yourself more.",
+        ],
+        "relentless_love": [
+            "I'm here with you, and I believe in you completely.",
+            "No matter what, you matter. Your life matters. Your wellbeing matters.",
+            "I see your strength, your courage, and your beautiful heart.",
+            "You are worthy of every good thing - safety, peace, love, joy, freedom.",
+        ],
+        "self_worth": [
+            "You don't have to prove your worth - you already have it.",
+            "Your value isn't diminished by how you've been treated.",
+            "You are irreplaceable, unique, and precious.",
+            "The world needs you in it, whole and free.",
+        ]
+    }
+
+
+def _compile_patterns(patterns: Dict[Any, List[str]]) -> Dict[Any, List["re.Pattern[str]"]]:
+    """Compile a category -> pattern list mapping"""
+    return {key: [re.compile(p) for p in plist] for key, plist in patterns.items()}
+
+
+def _categorize_affirmations(library: List[str]) -> Dict[str, List[str]]:
+    """Group affirmations by the need they speak to"""
+    keywords = {
+        "worth": ("worth", "fault"),
+        "hope": ("hope", "possible"),
+        "strength": ("strength", "brave"),
+    }
+    buckets = {
+        need: [a for a in library if any(k in a.lower() for k in words)]
+        for need, words in keywords.items()
+    }
+    buckets["default"] = list(library)
+    # Never leave a bucket empty - fall back to the first affirmation
+    return {need: bucket or library[:1] for need, bucket in buckets.items()}
+
+
+@lru_cache(maxsize=1)
+def _build_crisis_keywords() -> List[str]:
+    """Build crisis detection patterns"""
+    return [
+        r"\bright now\b", r"\btonight\b", r"\bhe's here\b", r"\bshe's here\b",
+        r"\bdanger\b", r"\bhurt me\b", r"\bkill\b", r"\bsuicide\b",
+        r"\bcan't take it\b", r"\bend it\b"
+    ]
+
+
+# Compiled pattern sets are built on first use and shared by every engine
+# instance (engines only hold references, never copies)
+@lru_cache(maxsize=1)
+def _emotion_regexes() -> Dict[EmotionType, List["re.Pattern[str]"]]:
+    return _compile_patterns(_build_emotion_patterns())
+
+
+@lru_cache(maxsize=1)
+def _trauma_regexes() -> Dict[TraumaIndicator, List["re.Pattern[str]"]]:
+    return _compile_patterns(_build_trauma_patterns())
+
+
+@lru_cache(maxsize=1)
+def _crisis_regexes() -> List["re.Pattern[str]"]:
+    return [re.compile(p) for p in _build_crisis_keywords()]
+
+
+@lru_cache(maxsize=1)
+def _resource_re() -> "re.Pattern[str]":
+    return re.compile(r"help|need|where|shelter|escape|leave")
+
+
+@lru_cache(maxsize=1)
+def _affirm_buckets() -> Dict[str, List[str]]:
+    return _categorize_affirmations(_build_affirmation_library())
+
+
+_REGEX_META = frozenset("\\.^$*+?{}[]|()")
+
+# (literal keywords, true regexes) for one detection category
+PatternSplit = Tuple[Tuple[str, ...], Tuple["re.Pattern[str]", ...]]
+
+
+def _split_literals(regexes: List["re.Pattern[str]"]) -> PatternSplit:
+    """Separate plain keywords (matched by substring search) from real regexes"""
+    literals = tuple(r.pattern for r in regexes if _REGEX_META.isdisjoint(r.pattern))
+    others = tuple(r for r in regexes if not _REGEX_META.isdisjoint(r.pattern))
+    return literals, others
+
+
+@lru_cache(maxsize=1)
+def _emotion_matchers() -> Dict[EmotionType, PatternSplit]:
+    return {e: _split_literals(rs) for e, rs in _emotion_regexes().items()}
+
+
+@lru_cache(maxsize=1)
+def _trauma_matchers() -> Dict[TraumaIndicator, PatternSplit]:
+    return {t: _split_literals(rs) for t, rs in _trauma_regexes().items()}
+
+
+@lru_cache(maxsize=1)
+def _all_literals() -> Tuple[str, ...]:
+    """Every distinct literal keyword across emotion and trauma patterns"""
+    literals: Dict[str, None] = {}
+    for matchers in (_emotion_matchers(), _trauma_matchers()):
+        for keywords, _ in matchers.values():
+            literals.update(dict.fromkeys(keywords))
+    return tuple(literals)
+
+
+@lru_cache(maxsize=1)
+def _literal_automaton() -> Optional[Any]:
+    """One Aho-Corasick automaton over all literal keywords, if available"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    return ahocorasick_rs.AhoCorasick(list(_all_literals()), matchkind=ahocorasick_rs.MatchKind.Standard)
+
+
+def _find_literals(message_lower: str) -> frozenset:
+    """Literal keywords present in the message, found in a single pass when possible"""
+    automaton = _literal_automaton()
+    if automaton is not None:
+        return frozenset(automaton.find_matches_as_strings(message_lower, overlapping=True))
+    return frozenset(k for k in _all_literals() if k in message_lower)
+
+
+@lru_cache(maxsize=1)
+def _min_literal_len() -> int:
+    """Length of the shortest literal keyword; shorter messages contain none of them"""
+    return min(map(len, _all_literals()))
+
+
 class AdvancedEmpathyEngine:
     """
     Sierra's Advanced Empathy Engine
@@ -85,7 +403,68 @@ class AdvancedEmpathyEngine:
     - +100: Adaptive response to individual needs
     """
 
-    def __init__(self):
+    # Response tables are built once with the class, not per response
+    _VALIDATIONS: Dict[EmotionType, str] = {
+        EmotionType.FEAR: "What you're feeling - that fear - is completely understandable. Fear is your body's way of trying to protect you.",
+        EmotionType.SADNESS: "I hear the pain in your words. It makes sense that you'd feel this deep sadness given what you're going through.",
+        EmotionType.ANGER: "Your anger is valid. It's a natural response to being treated in ways that aren't okay.",
+        EmotionType.SHAME: "I want you to know - shame is not yours to carry. What's happened to you is not a reflection of your worth.",
+        EmotionType.GUILT: "The guilt you're feeling is real, but I want to gently remind you - you're not responsible for someone else's choices.",
+        EmotionType.CONFUSION: "Feeling confused and pulled in different directions - that's so normal in these situations. Your confusion makes sense.",
+        EmotionType.LONELINESS: "Feeling alone in this is incredibly hard. I hear you, and I want you to know you're not alone anymore.",
+        EmotionType.OVERWHELM: "Being overwhelmed makes complete sense - you're dealing with so much. It's okay to feel like it's too much.",
+        EmotionType.NUMBNESS: "Numbness is a way your mind protects you when things are too much. It's okay if you can't feel everything right now.",
+        EmotionType.DESPAIR: "I hear the hopelessness you're feeling. When you're in the middle of it, it can feel like there's no way through.",
+        EmotionType.ANXIETY: "That constant state of anxiety and stress - it's exhausting. Your nervous system is working overtime to keep you safe.",
+        EmotionType.HOPE: "I hear the hope in your words, even if it feels fragile. That hope is a testament to your resilience.",
+    }
+    _DEFAULT_VALIDATION = "I hear you, and what you're feeling matters."
+
+    # (predicate, statement) pairs - first match wins
+    _SUPPORT_RULES: Tuple[Tuple[Callable[[EmotionalState], bool], str], ...] = (
+        (lambda s: s.crisis_level >= 7,
+         "I'm here with you right now. You don't have to face this moment alone. Let's take this one breath at a time."),
+        (lambda s: s.needs_grounding,
+         "I'm here, grounding this moment with you. You're safe in this conversation. Take all the time you need."),
+        (lambda s: s.intensity > 0.7,
+         "I'm holding space for all of these big feelings. They're welcome here, and so are you."),
+    )
+    _DEFAULT_SUPPORT = "I'm here to listen, to support you, and to remind you that you matter."
+
+    _GUIDANCE_RULES: Tuple[Tuple[Callable[[EmotionalState], bool], str], ...] = (
+        (lambda s: s.needs_resources,
+         "Would it help to explore what resources and support are available to you? We can do that together, at your pace."),
+        (lambda s: s.crisis_level >= 5,
+         "If you're open to it, we could talk about ways to help you feel safer right now."),
+        (lambda s: s.primary_emotion == EmotionType.CONFUSION,
+         "Sometimes talking through the confusion can help. Would you like to explore what you're feeling?"),
+    )
+
+    # (predicate, love_statements category) pairs - first match wins
+    _LOVE_ROUTES: Tuple[Tuple[Callable[[EmotionalState], bool], str], ...] = (
+        (lambda s: s.primary_emotion in (EmotionType.SHAME, EmotionType.GUILT), "self_worth"),
+        (lambda s: s.needs_affirmation, "relentless_love"),
+        (lambda s: s.primary_emotion == EmotionType.HOPE, "love_in_action"),
+    )
+    _DEFAULT_LOVE_ROUTE = "unconditional_love"
+
+    # Emotions / trauma indicators that trigger affirmation or grounding
+    _AFFIRM_EMOTIONS = frozenset({
+        EmotionType.SHAME, EmotionType.GUILT, EmotionType.DESPAIR, EmotionType.LONELINESS
+    })
+    _GROUND_INDICATORS = frozenset({
+        TraumaIndicator.DISSOCIATION, TraumaIndicator.FLASHBACK, TraumaIndicator.TRIGGER
+    })
+
+    _AFFIRM_BUCKET_FOR_EMOTION: Dict[EmotionType, str] = {
+        EmotionType.SHAME: "worth",
+        EmotionType.GUILT: "worth",
+        EmotionType.DESPAIR: "hope",
+        EmotionType.FEAR: "strength",
+        EmotionType.ANXIETY: "strength",
+    }
+
+    def __init__(self) -> None:
         self.empathy_baseline = 1000
         self.trauma_informed_bonus = 300
         self.cultural_sensitivity = 200
@@ -100,181 +479,53 @@ class AdvancedEmpathyEngine:
             self.adaptive_response
         )
 
-        # Emotional lexicon for detection
-        self.emotion_patterns = self._build_emotion_patterns()
-        self.trauma_patterns = self._build_trauma_patterns()
-        self.affirmation_library = self._build_affirmation_library()
-        self.love_statements = self._build_love_statements()
+        self._rng = random.Random()
 
-    def _build_emotion_patterns(self) -> Dict[EmotionType, List[str]]:
-        """Build comprehensive emotion detection patterns"""
-        return {
-            EmotionType.FEAR: [
-                r'\bscared\b', r'\bafraid\b', r'\bterrified\b', r'\bfrightened\b',
-                r'\bworried\b', r'\bnervous\b', r'\bpanic', r'\bdread', r'\bfear',
-                r"what if he", r"what if she", r"i'm afraid", r"makes me scared"
-            ],
-            EmotionType.SADNESS: [
-                r'\bsad\b', r'\bdepressed\b', r'\bunhappy\b', r'\bmiserable\b',
-                r'\bhurt(?:ing)?\b', r'\bheartbr', r'\bcry(?:ing)?\b', r'\btears\b',
-                r'\bdown\b', r'\bupset\b', r"can't stop crying", r"feel empty"
-            ],
-            EmotionType.ANGER: [
-                r'\bangry\b', r'\bmad\b', r'\bfurious\b', r'\benraged\b',
-                r'\bpissed\b', r'\bfrustrat', r'\bhate\b', r'\bresentment\b',
-                r"so angry", r"makes me mad", r"i hate", r"fucking"
-            ],
-            EmotionType.SHAME: [
-                r'\bashamed\b', r'\bembarrass', r'\bhumiliat', r'\bpathetic\b',
-                r'\bworthless\b', r'\bdisgusting\b', r"my fault", r"i deserve",
-                r"so stupid", r"what's wrong with me", r"i'm nothing"
-            ],
-            EmotionType.GUILT: [
-                r'\bguilty\b', r'\bguilt\b', r'\bblame myself\b', r'\bmy fault\b',
-                r"should have", r"shouldn't have", r"if only i", r"i caused"
-            ],
-            EmotionType.CONFUSION: [
-                r"\bconfused\b", r"\bdon't understand\b", r"\bwhy\b", r"\bmixed feelings\b",
-                r"don't know", r"can't tell", r"makes no sense", r"contradicting"
-            ],
-            EmotionType.HOPE: [
-                r'\bhope\b', r'\bmaybe\b', r'\bcould be better\b', r'\bwant to\b',
-                r"things might", r"hoping", r"possibly", r"dream of"
-            ],
-            EmotionType.LONELINESS: [
-                r'\balone\b', r'\blonely\b', r'\bisolated\b', r'\bno one\b',
-                r"by myself", r"nobody understands", r"all alone", r"isolated"
-            ],
-            EmotionType.OVERWHELM: [
-                r'\boverwhelm', r'\btoo much\b', r"\bcan't handle\b", r"\bcan't cope\b",
-                r"drowning", r"can't breathe", r"crumbling", r"falling apart"
-            ],
-            EmotionType.NUMBNESS: [
-                r'\bnumb\b', r'\bnothing\b', r"\bdon't feel\b", r'\bempty\b',
-                r"feel nothing", r"can't feel", r"shut down", r"detached"
-            ],
-            EmotionType.ANXIETY: [
-                r'\banxious\b', r'\banxiety\b', r'\bstress', r'\btense\b',
-                r"can't relax", r"on edge", r"constantly worried", r"racing thoughts"
-            ],
-            EmotionType.DESPAIR: [
-                r'\bhopeless\b', r'\bdespair\b', r'\bgive up\b', r'\bno point\b',
-                r"can't go on", r"no way out", r"never get better", r"pointless"
-            ]
-        }
+    # Emotional lexicon for detection - built lazily on first access so
+    # importing the module and constructing an engine stay cheap
+    @cached_property
+    def emotion_patterns(self) -> Dict[EmotionType, List[str]]:
+        return _build_emotion_patterns()
 
-    def _build_trauma_patterns(self) -> Dict[TraumaIndicator, List[str]]:
-        """Build trauma response detection patterns"""
-        return {
-            TraumaIndicator.HYPERVIGILANCE: [
-                r"always watching", r"on guard", r"waiting for", r"checking",
-                r"can't relax", r"constantly aware", r"monitoring"
-            ],
-            TraumaIndicator.DISSOCIATION: [
-                r"out of body", r"watching myself", r"not real", r"floating",
-                r"disconnected", r"numb", r"autopilot", r"foggy"
-            ],
-            TraumaIndicator.FLASHBACK: [
-                r"keep seeing", r"reliving", r"back there", r"happening again",
-                r"can't stop seeing", r"playing over"
-            ],
-            TraumaIndicator.TRIGGER: [
-                r"reminds me", r"brings back", r"sets me off", r"makes me think of",
-                r"triggered", r"brought it all back"
-            ],
-            TraumaIndicator.FREEZE_RESPONSE: [
-                r"can't move", r"frozen", r"paralyzed", r"stuck",
-                r"couldn't do anything", r"just stood there"
-            ],
-            TraumaIndicator.FAWN_RESPONSE: [
-                r"tried to please", r"make them happy", r"keep the peace",
-                r"avoid conflict", r"be perfect", r"not upset them"
-            ]
-        }
+    @cached_property
+    def trauma_patterns(self) -> Dict[TraumaIndicator, List[str]]:
+        return _build_trauma_patterns()
 
-    def _build_affirmation_library(self) -> List[str]:
-        """Build library of affirmations organized by need"""
-        return [
-            # Core worth affirmations
-            "You are inherently valuable, just as you are.",
-            "Your worth is not determined by anyone else's treatment of you.",
-            "You deserve love, safety, and respect - always.",
-            "You are enough, exactly as you are in this moment.",
-
-            # Strength affirmations
-            "The fact that you're here, talking about this - that's incredible strength.",
-            "Surviving takes tremendous courage, and you're doing it.",
-            "You're stronger than you know, and braver than you feel.",
-            "Every day you get through is a testament to your resilience.",
-
-            # Choice affirmations
-            "You have the right to make your own choices, in your own time.",
-            "Whatever you decide, your autonomy matters.",
-            "You know your situation better than anyone else.",
-            "There's no wrong choice when you're doing what you need to survive.",
-
-            # Feeling validation
-            "All of your feelings are valid - every single one.",
-            "It's okay to feel multiple, contradicting emotions at once.",
-            "You're allowed to feel however you feel, without judgment.",
-            "Your feelings make sense given what you've experienced.",
-
-            # Hope affirmations
-            "Healing is possible, even when it doesn't feel like it.",
-            "You deserve a life filled with peace and joy.",
-            "Better days are possible, and you deserve them.",
-            "Your story doesn't end here - there's so much more ahead.",
-
-            # Not alone
-            "You are not alone in this, even when it feels that way.",
-            "What you're experiencing is not your fault.",
-            "Many people have walked this path and found their way to safety.",
-            "You deserve support, and it's available to you.",
-
-            # Self-compassion
-            "Be gentle with yourself - you're doing the best you can.",
-            "You deserve the same compassion you'd give to someone you love.",
-            "It's okay to take things one moment at a time.",
-            "You don't have to have all the answers right now."
-        ]
+    @cached_property
+    def affirmation_library(self) -> List[str]:
+        return _build_affirmation_library()
 
-    def _build_love_statements(self) -> Dict[str, List[str]]:
-        """
-        Build love-centered statements
-        Core Mission: "How can we help you love yourself more?"
-        """
-        return {
-            "unconditional_love": [
-                "You are deeply worthy of love - not because of what you do, but because of who you are.",
-                "Love is your birthright. You don't have to earn it.",
-                "You deserve to be loved in a way that feels safe, gentle, and affirming.",
-                "The love you deserve doesn't come with fear, control, or conditions.",
-            ],
-            "self_love_invitation": [
-                "What if we could help you see yourself the way you deserve to be seen - with love and compassion?",
-                "You're learning to love yourself, and that's one of the bravest journeys.",
-                "Loving yourself isn't selfish - it's essential. You deserve your own kindness.",
-                "What would it feel like to treat yourself with the gentleness you'd give someone you love?",
-            ],
-            "love_in_action": [
-                "Choosing your safety is an act of self-love.",
-                "Setting boundaries is loving yourself.",
-                "Taking time to heal is how you love yourself forward.",
-                "Every step you take toward peace is you loving yourself more.",
-            ],
-            "relentless_love": [
-                "I'm here with you, and I believe in you completely.",
-                "No matter what, you matter. Your life matters. Your wellbeing matters.",
-                "I see your strength, your courage, and your beautiful heart.",
-                "You are worthy of every good thing - safety, peace, love, joy, freedom.",
-            ],
-            "self_worth": [
-                "You don't have to prove your worth - you already have it.",
-                "Your value isn't diminished by how you've been treated.",
-                "You are irreplaceable, unique, and precious.",
-                "The world needs you in it, whole and free.",
-            ]
-        }
+    @cached_property
+    def love_statements(self) -> Dict[str, List[str]]:
+        return _build_love_statements()
+
+    @cached_property
+    def _emotion_regexes(self) -> Dict[EmotionType, List["re.Pattern[str]"]]:
+        return _emotion_regexes()
+
+    @cached_property
+    def _trauma_regexes(self) -> Dict[TraumaIndicator, List["re.Pattern[str]"]]:
+        return _trauma_regexes()
+
+    @cached_property
+    def _emotion_matchers(self) -> Dict[EmotionType, PatternSplit]:
+        return _emotion_matchers()
+
+    @cached_property
+    def _trauma_matchers(self) -> Dict[TraumaIndicator, PatternSplit]:
+        return _trauma_matchers()
+
+    @cached_property
+    def _crisis_regexes(self) -> List["re.Pattern[str]"]:
+        return _crisis_regexes()
+
+    @cached_property
+    def _resource_re(self) -> "re.Pattern[str]":
+        return _resource_re()
+
+    @cached_property
+    def _affirm_buckets(self) -> Dict[str, List[str]]:
+        return _affirm_buckets()
 
     def analyze_emotional_state(self, message: str, context: Optional[List[str]] = None) -> EmotionalState:
         """
@@ -287,64 +538,134 @@ class AdvancedEmpathyEngine:
         Returns:
             EmotionalState with detected emotions, trauma indicators, and needs
         """
-        message_lower = message.lower()
+        # Lowered once; every scan below shares this buffer
+        message_lower = message.casefold()
+        if len(message_lower) <= ANALYSIS_CACHE_MAX_CHARS:
+            return _cached_analysis(message_lower)
+        return self._analyze_lowered(message_lower)
+
+    def _analyze_lowered(self, message_lower: str) -> EmotionalState:
+        """Run the full emotion/trauma/crisis analysis on a casefolded message"""
+        # Plain keywords are found in one pass; only real regexes run per
+        # pattern. Messages shorter than every keyword ("ok", "yes") skip the
+        # keyword pass entirely.
+        if len(message_lower) >= _min_literal_len():
+            found = _find_literals(message_lower)
+        else:
+            found = frozenset()
 
         # Detect emotions
-        detected_emotions = {}
-        for emotion, patterns in self.emotion_patterns.items():
+        detected_emotions: Dict[EmotionType, int] = {}
+        for emotion, (keywords, regexes) in self._emotion_matchers.items():
             score = 0
-            for pattern in patterns:
-                if re.search(pattern, message_lower):
+            for keyword in keywords:
+                if keyword in found:
+                    score += 1
+            for regex in regexes:
+                if regex.search(message_lower):
                     score += 1
             if score > 0:
                 detected_emotions[emotion] = score
 
+        # Detect trauma indicators
+        trauma_indicators: List[TraumaIndicator] = []
+        for indicator, (keywords, regexes) in self._trauma_matchers.items():
+            if not found.isdisjoint(keywords) or any(r.search(message_lower) for r in regexes):
+                trauma_indicators.append(indicator)
+
+        crisis_score = sum(1 for regex in self._crisis_regexes if regex.search(message_lower))
+
+        resource_hit = bool(self._resource_re.search(message_lower))
+
+        return self._build_emotional_state(detected_emotions, trauma_indicators, crisis_score, resource_hit)
+
+    def analyze_emotional_state_batch(self, messages: List[str]) -> List[EmotionalState]:
+        """
+        Analyze a batch of messages (triage queues, offline evaluation)
+
+        Uses PyArrow's vectorized regex kernels - one native call per pattern
+        across the whole batch - when available, and falls back to
+        per-message analysis otherwise.
+
+        Args:
+            messages: User messages to analyze
+
+        Returns:
+            One EmotionalState per message, in input order
+        """
+        arrow = _arrow_modules() if messages else None
+        if arrow is None:
+            return [self.analyze_emotional_state(m) for m in messages]
+        np, pa, pc = arrow
+
+        lowered = pa.array([m.casefold() for m in messages], type=pa.large_string())
+
+        def pattern_hits(regexes: List["re.Pattern[str]"]) -> "np.ndarray":
+            # (n_messages, n_patterns) boolean matrix
+            return np.column_stack([
+                pc.match_substring_regex(lowered, pattern=r.pattern).to_numpy(zero_copy_only=False)
+                for r in regexes
+            ])
+
+        emotions = list(self._emotion_regexes)
+        emotion_scores = np.column_stack([
+            pattern_hits(self._emotion_regexes[e]).sum(axis=1) for e in emotions
+        ])
+        indicators = list(self._trauma_regexes)
+        trauma_hits = np.column_stack([
+            pattern_hits(self._trauma_regexes[t]).any(axis=1) for t in indicators
+        ])
+        crisis_scores = pattern_hits(self._crisis_regexes).sum(axis=1)
+        resource_hits = pattern_hits([self._resource_re])[:, 0]
+
+        states = []
+        for row in range(len(messages)):
+            detected_emotions = {
+                emotions[col]: int(emotion_scores[row, col])
+                for col in np.flatnonzero(emotion_scores[row])
+            }
+            trauma_indicators = [indicators[col] for col in np.flatnonzero(trauma_hits[row])]
+            states.append(self._build_emotional_state(
+                detected_emotions, trauma_indicators,
+                int(crisis_scores[row]), bool(resource_hits[row])
+            ))
+        return states
+
+    def _build_emotional_state(
+        self,
+        detected_emotions: Dict[EmotionType, int],
+        trauma_indicators: List[TraumaIndicator],
+        crisis_score: int,
+        resource_hit: bool
+    ) -> EmotionalState:
+        """Derive primary emotion, crisis level and needs from raw detection hits"""
         # Determine primary and secondary emotions
         if detected_emotions:
-            sorted_emotions = sorted(detected_emotions.items(), key=lambda x: x[1], reverse=True)
-            primary_emotion = sorted_emotions[0][0]
-            secondary_emotions = [e[0] for e in sorted_emotions[1:4]]
-            intensity = min(sorted_emotions[0][1] / 3.0, 1.0)
+            # Only the top 4 are ever used (1 primary + 3 secondary)
+            top_emotions = heapq.nlargest(4, detected_emotions.items(), key=operator.itemgetter(1))
+            primary_emotion = top_emotions[0][0]
+            secondary_emotions = tuple(e[0] for e in top_emotions[1:4])
+            intensity = min(top_emotions[0][1] / 3.0, 1.0)
         else:
             primary_emotion = EmotionType.CONFUSION
-            secondary_emotions = []
+            secondary_emotions = ()
             intensity = 0.3
 
-        # Detect trauma indicators
-        trauma_indicators = []
-        for indicator, patterns in self.trauma_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, message_lower):
-                    trauma_indicators.append(indicator)
-                    break
-
         # Calculate crisis level
-        crisis_keywords = [
-            r"\bright now\b", r"\btonight\b", r"\bhe's here\b", r"\bshe's here\b",
-            r"\bdanger\b", r"\bhurt me\b", r"\bkill\b", r"\bsuicide\b",
-            r"\bcan't take it\b", r"\bend it\b"
-        ]
-        crisis_score = sum(1 for pattern in crisis_keywords if re.search(pattern, message_lower))
         crisis_level = min(crisis_score * 2, 10)
 
         # Determine needs
-        needs_affirmation = any(e in detected_emotions for e in [
-            EmotionType.SHAME, EmotionType.GUILT, EmotionType.DESPAIR, EmotionType.LONELINESS
-        ])
+        needs_affirmation = not self._AFFIRM_EMOTIONS.isdisjoint(detected_emotions)
 
-        needs_grounding = any(t in trauma_indicators for t in [
-            TraumaIndicator.DISSOCIATION, TraumaIndicator.FLASHBACK, TraumaIndicator.TRIGGER
-        ])
+        needs_grounding = not self._GROUND_INDICATORS.isdisjoint(trauma_indicators)
 
-        needs_resources = crisis_level > 5 or any(word in message_lower for word in [
-            "help", "need", "where", "shelter", "escape", "leave"
-        ])
+        needs_resources = crisis_level > 5 or resource_hit
 
         return EmotionalState(
             primary_emotion=primary_emotion,
             secondary_emotions=secondary_emotions,
             intensity=intensity,
-            trauma_indicators=trauma_indicators,
+            trauma_indicators=tuple(trauma_indicators),
             crisis_level=crisis_level,
             needs_affirmation=needs_affirmation,
             needs_grounding=needs_grounding,
@@ -393,78 +714,28 @@ class AdvancedEmpathyEngine:
 
     def _generate_validation(self, state: EmotionalState, message: str) -> str:
         """Generate validating response to their emotions"""
-        emotion = state.primary_emotion
-
-        validations = {
-            EmotionType.FEAR: "What you're feeling - that fear - is completely understandable. Fear is your body's way of trying to protect you.",
-            EmotionType.SADNESS: "I hear the pain in your words. It makes sense that you'd feel this deep sadness given what you're going through.",
-            EmotionType.ANGER: "Your anger is valid. It's a natural response to being treated in ways that aren't okay.",
-            EmotionType.SHAME: "I want you to know - shame is not yours to carry. What's happened to you is not a reflection of your worth.",
-            EmotionType.GUILT: "The guilt you're feeling is real, but I want to gently remind you - you're not responsible for someone else's choices.",
-            EmotionType.CONFUSION: "Feeling confused and pulled in different directions - that's so normal in these situations. Your confusion makes sense.",
-            EmotionType.LONELINESS: "Feeling alone in this is incredibly hard. I hear you, and I want you to know you're not alone anymore.",
-            EmotionType.OVERWHELM: "Being overwhelmed makes complete sense - you're dealing with so much. It's okay to feel like it's too much.",
-            EmotionType.NUMBNESS: "Numbness is a way your mind protects you when things are too much. It's okay if you can't feel everything right now.",
-            EmotionType.DESPAIR: "I hear the hopelessness you're feeling. When you're in the middle of it, it can feel like there's no way through.",
-            EmotionType.ANXIETY: "That constant state of anxiety and stress - it's exhausting. Your nervous system is working overtime to keep you safe.",
-            EmotionType.HOPE: "I hear the hope in your words, even if it feels fragile. That hope is a testament to your resilience.",
-        }
-
-        return validations.get(emotion, "I hear you, and what you're feeling matters.")
+        return self._VALIDATIONS.get(state.primary_emotion, self._DEFAULT_VALIDATION)
 
     def _select_affirmation(self, state: EmotionalState) -> str:
         """Select appropriate affirmation"""
-        import random
-
-        if state.primary_emotion in [EmotionType.SHAME, EmotionType.GUILT]:
-            affirmations = [a for a in self.affirmation_library if "worth" in a.lower() or "fault" in a.lower()]
-        elif state.primary_emotion in [EmotionType.DESPAIR, EmotionType.HOPELESS]:
-            affirmations = [a for a in self.affirmation_library if "hope" in a.lower() or "possible" in a.lower()]
-        elif state.primary_emotion in [EmotionType.FEAR, EmotionType.ANXIETY]:
-            affirmations = [a for a in self.affirmation_library if "strength" in a.lower() or "brave" in a.lower()]
-        else:
-            affirmations = self.affirmation_library
-
-        return random.choice(affirmations) if affirmations else self.affirmation_library[0]
+        bucket = self._AFFIRM_BUCKET_FOR_EMOTION.get(state.primary_emotion, "default")
+        return self._rng.choice(self._affirm_buckets[bucket])
 
     def _generate_support(self, state: EmotionalState) -> str:
         """Generate supportive statement"""
-        if state.crisis_level >= 7:
-            return "I'm here with you right now. You don't have to face this moment alone. Let's take this one breath at a time."
-        elif state.needs_grounding:
-            return "I'm here, grounding this moment with you. You're safe in this conversation. Take all the time you need."
-        elif state.intensity > 0.7:
-            return "I'm holding space for all of these big feelings. They're welcome here, and so are you."
-        else:
-            return "I'm here to listen, to support you, and to remind you that you matter."
+        return next((msg for rule, msg in self._SUPPORT_RULES if rule(state)), self._DEFAULT_SUPPORT)
 
     def _generate_guidance(self, state: EmotionalState) -> Optional[str]:
         """Generate gentle guidance if appropriate"""
-        if state.needs_resources:
-            return "Would it help to explore what resources and support are available to you? We can do that together, at your pace."
-        elif state.crisis_level >= 5:
-            return "If you're open to it, we could talk about ways to help you feel safer right now."
-        elif state.primary_emotion == EmotionType.CONFUSION:
-            return "Sometimes talking through the confusion can help. Would you like to explore what you're feeling?"
-        return None
+        return next((msg for rule, msg in self._GUIDANCE_RULES if rule(state)), None)
 
     def _generate_love_statement(self, state: EmotionalState) -> str:
         """
         Generate love-centered statement
         Core: "How can we help you love yourself more?"
         """
-        import random
-
-        if state.primary_emotion in [EmotionType.SHAME, EmotionType.GUILT]:
-            statements = self.love_statements["self_worth"]
-        elif state.needs_affirmation:
-            statements = self.love_statements["relentless_love"]
-        elif state.primary_emotion == EmotionType.HOPE:
-            statements = self.love_statements["love_in_action"]
-        else:
-            statements = self.love_statements["unconditional_love"]
-
-        return random.choice(statements)
+        category = next((cat for rule, cat in self._LOVE_ROUTES if rule(state)), self._DEFAULT_LOVE_ROUTE)
+        return self._rng.choice(self.love_statements[category])
 
     def _calculate_response_empathy(self, state: EmotionalState) -> float:
         """
@@ -507,3 +778,21 @@ class AdvancedEmpathyEngine:
             "core_mission": "How can we help you love yourself more?",
             "core_values": ["Love", "Compassion", "Non-judgment", "Empowerment"]
         }
+
+
+# Analysis depends only on the message text (engines hold no per-instance
+# analysis state), so one cache serves every engine and repeated messages
+# (retries, replays) skip the scans. Only messages up to
+# ANALYSIS_CACHE_MAX_CHARS are cached, which bounds the cache at roughly
+# 2048 x (512-character key + one small EmotionalState) - about 1-2 MB.
+ANALYSIS_CACHE_MAX_CHARS = 512
+
+
+@lru_cache(maxsize=1)
+def _shared_analyzer() -> AdvancedEmpathyEngine:
+    return AdvancedEmpathyEngine()
+
+
+@lru_cache(maxsize=2048)
+def _cached_analysis(message_lower: str) -> EmotionalState:
+    return _shared_analyzer()._analyze_lowered(message_lower)
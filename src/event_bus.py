@@ -24,16 +24,46 @@ Example Events:
 Core Mission: "How can we help you love yourself more?"
 """
 
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import itertools
+import json
 import logging
+import sys
 import threading
 import time
-import queue
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import uuid
 
+# Cython dispatcher built in place (cythonize -i src/_bus_dispatch.pyx): a
+# sibling module when imported as src.event_bus, top-level when src/ is on sys.path
+try:
+    from ._bus_dispatch import make_dispatcher as _native_make_dispatcher
+    NATIVE_DISPATCH_AVAILABLE = True
+except ImportError:
+    try:
+        from _bus_dispatch import make_dispatcher as _native_make_dispatcher
+        NATIVE_DISPATCH_AVAILABLE = True
+    except ImportError:
+        _native_make_dispatcher = None
+        NATIVE_DISPATCH_AVAILABLE = False
+
+# Fast JSON for audit serialization: orjson, then msgspec, then stdlib json
+try:
+    import orjson
+    FAST_JSON_BACKEND: Optional[str] = "orjson"
+except ImportError:
+    try:
+        import msgspec
+        FAST_JSON_BACKEND = "msgspec"
+    except ImportError:
+        FAST_JSON_BACKEND = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,7 +75,21 @@ class EventPriority(Enum):
     LOW = 4        # Background events
 
 
-@dataclass
+# Plain-int priorities for hot-path comparisons (EventPriority stays the public API)
+P_CRITICAL, P_HIGH, P_NORMAL, P_LOW = 1, 2, 3, 4
+
+# Either form of a priority → (EventPriority, int), so publish normalizes
+# with one dict lookup
+_PRIORITY_LOOKUP: Dict[Any, Tuple[EventPriority, int]] = {}
+for _p in EventPriority:
+    _PRIORITY_LOOKUP[_p] = _PRIORITY_LOOKUP[_p.value] = (_p, _p.value)
+del _p
+
+# Per-priority dispatch buckets (index = priority.value - 1)
+_NUM_PRIORITIES = len(EventPriority)
+
+
+@dataclass(slots=True)
 class Event:
     """
     Event published to the bus
@@ -55,23 +99,55 @@ class Event:
         priority: Processing priority
         source_module: Module that published this event
         data: Event payload
-        timestamp: When event was created
+        created_at: When event was created (epoch seconds)
         event_id: Unique identifier
         correlation_id: For tracking related events
+        priority_value: priority.value cached as a plain int for hot-path checks
     """
     event_type: str
     priority: EventPriority
     source_module: str
     data: Dict[str, Any]
-    timestamp: datetime = field(default_factory=datetime.now)
+    created_at: float = field(default_factory=time.time)
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     correlation_id: Optional[str] = None
+    priority_value: int = field(init=False)
+
+    def __post_init__(self):
+        self.priority_value = self.priority.value
 
-    def __lt__(self, other):
-        """Compare by priority, then timestamp"""
-        if self.priority.value != other.priority.value:
-            return self.priority.value < other.priority.value
-        return self.timestamp < other.timestamp
+    @property
+    def timestamp(self) -> datetime:
+        """When event was created, as a local datetime"""
+        return datetime.fromtimestamp(self.created_at)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Audit record for this event (JSON-compatible apart from data)"""
+        return {
+            "event_id": self.event_id,
+            "event_type": self.event_type,
+            "priority": self.priority.name,
+            "source_module": self.source_module,
+            "created_at": self.created_at,
+            "correlation_id": self.correlation_id,
+            "data": self.data,
+        }
+
+    def to_bytes(self) -> bytes:
+        """Serialize the audit record as UTF-8 JSON (non-JSON payload values are str()'d)"""
+        return _encode_json(self.to_dict())
+
+
+def _encode_json(record: Dict[str, Any]) -> bytes:
+    if FAST_JSON_BACKEND == "orjson":
+        return orjson.dumps(record, default=str)
+    if FAST_JSON_BACKEND == "msgspec":
+        return _msgspec_encoder.encode(record)
+    return json.dumps(record, default=str, separators=(",", ":")).encode("utf-8")
+
+
+if FAST_JSON_BACKEND == "msgspec":
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=str)
 
 
 @dataclass
@@ -91,6 +167,114 @@ class Subscription:
     priority_filter: Optional[EventPriority] = None
 
 
+class _EventCounter:
+    """
+    Thread-safe counter for publish statistics
+
+    Each thread increments only its own cell (keyed by thread id), so
+    concurrent publishers can't lose increments the way a shared
+    `self.n += 1` can. Reading sums a snapshot of the cells and changes
+    nothing, so concurrent readers always see a consistent total.
+    """
+    __slots__ = ("_cells",)
+
+    def __init__(self):
+        self._cells: Dict[int, int] = {}
+
+    def increment(self):
+        cells = self._cells
+        ident = threading.get_ident()
+        cells[ident] = cells.get(ident, 0) + 1
+
+    @property
+    def value(self) -> int:
+        # dict.copy() is atomic, so a thread adding its first cell can't
+        # break the iteration
+        return sum(self._cells.copy().values())
+
+
+class _DropReporter:
+    """
+    Counts dropped work and logs a summary at most once per interval
+
+    Drops happen exactly when the bus is saturated, so logging each one would
+    flood the log at the worst moment. `message` is a %-style format taking
+    the number of drops since the last summary.
+    """
+    __slots__ = ("_message", "_interval", "_pending", "_last_report", "total", "_lock")
+
+    def __init__(self, message: str, interval: float = 5.0):
+        self._message = message
+        self._interval = interval
+        self._pending = 0
+        self._last_report = 0.0
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def record(self):
+        with self._lock:
+            self._pending += 1
+            self.total += 1
+            now = time.monotonic()
+            if now - self._last_report < self._interval:
+                return
+            count, self._pending = self._pending, 0
+            self._last_report = now
+        logger.warning(self._message, count)
+
+
+# A dispatch bucket: the eligible subscribers plus a specialized function
+# that calls all of their callbacks
+DispatchBucket = Tuple[Tuple[Subscription, ...], Callable[[Event], None]]
+
+
+@functools.lru_cache(maxsize=None)
+def _dispatcher_factory(n: int) -> Callable:
+    """
+    Compile a dispatcher maker for exactly n callbacks
+
+    The generated function calls each callback inline with its own
+    try/except, so dispatch has no per-subscriber loop overhead. Source
+    depends only on n, so each arity is compiled once.
+    """
+    lines = ["def make(_cbs, _err):"]
+    lines += [f"    cb{i} = _cbs[{i}]" for i in range(n)]
+    lines.append("    def dispatch(event):")
+    for i in range(n):
+        lines += [
+            "        try:",
+            f"            cb{i}(event)",
+            "        except Exception as exc:",
+            f"            _err({i}, exc)",
+        ]
+    if n == 0:
+        lines.append("        pass")
+    lines.append("    return dispatch")
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<event_bus_dispatch:{n}>", "exec"), namespace)
+    return namespace["make"]
+
+
+def _make_dispatch_bucket(subscriptions: Tuple[Subscription, ...]) -> DispatchBucket:
+    """Pair subscriptions with a generated dispatcher for their callbacks"""
+    def on_error(index: int, exc: Exception):
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Subscriber %s callback failed: %s",
+                subscriptions[index].subscriber_id, exc,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+
+    callbacks = tuple(sub.callback for sub in subscriptions)
+    if NATIVE_DISPATCH_AVAILABLE:
+        return subscriptions, _native_make_dispatcher(callbacks, on_error)
+    return subscriptions, _dispatcher_factory(len(callbacks))(callbacks, on_error)
+
+
+_EMPTY_BUCKETS: Tuple[DispatchBucket, ...] = (_make_dispatch_bucket(()),) * _NUM_PRIORITIES
+
+
 class SierraEventBus:
     """
     Sierra's Event Bus - Pub/Sub Communication Backbone
@@ -103,8 +287,12 @@ class SierraEventBus:
     - Event filtering by priority
     - Audit trail for HIPAA compliance
     - Thread-safe
+    - CRITICAL events are delivered synchronously, in order, on the processor
+      thread; other callbacks run on a bounded worker pool so a slow
+      subscriber can't hold up crisis delivery
 
-    Singleton Pattern: Only ONE event bus exists
+    Shared Instance: get_event_bus() returns the one process-wide bus.
+    Constructing SierraEventBus directly gives an independent bus (tests).
 
     Integration:
     - All Sierra modules publish/subscribe through this bus
@@ -115,58 +303,108 @@ class SierraEventBus:
     - All modules subscribe to crisis_intervention for emergency override
     """
 
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        """Singleton: Only ONE event bus exists"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-
     def __init__(self):
-        """Initialize event bus (only once)"""
-        if self._initialized:
-            return
-
-        self._initialized = True
+        """Initialize event bus"""
+        # Event queue: one FIFO ring per priority (index = priority.value - 1).
+        # Publishers append without a shared mutex (deque.append is atomic)
+        # and the single processor drains higher-priority rings first.
+        # NORMAL/LOW rings are bounded; CRITICAL/HIGH are never dropped.
+        self.ring_capacity = 8192
+        self._rings: List[collections.deque] = [collections.deque() for _ in EventPriority]
+        self._wakeup = threading.Event()
+        self._seq = itertools.count()
+
+        # Event ids are "<bus node>-<seq>": unique and far cheaper than uuid4
+        self._node_id = uuid.uuid4().hex[:12]
+        self.drain_batch_size = 32  # Max events drained per wakeup
+        self._drain_buf: List[Event] = []  # Reused batch buffer (processor thread only)
+
+        # Subscriptions: event_type → immutable tuple of subscriptions.
+        # Writers swap in a new tuple under the lock (copy-on-write) so the
+        # dispatch path can read without locking.
+        self.subscriptions: Dict[str, Tuple[Subscription, ...]] = {}
+        self.subscription_lock = threading.Lock()
 
-        # Event queue (priority queue)
-        self.event_queue: queue.PriorityQueue = queue.PriorityQueue()
+        # Writer-side index: event_type → subscriber_id → that subscriber's
+        # subscriptions, so unsubscribe finds its targets in O(1)
+        self._subscriber_index: Dict[str, Dict[str, List[Subscription]]] = {}
 
-        # Subscriptions: event_type → list of subscriptions
-        self.subscriptions: Dict[str, List[Subscription]] = {}
-        self.subscription_lock = threading.Lock()
+        # Dispatch table derived from subscriptions: event_type → one bucket per
+        # priority holding only the subscribers (specific + wildcard) whose
+        # priority_filter admits that priority, plus a compiled dispatcher
+        # for them. Rebuilt on (un)subscribe.
+        self._dispatch_table: Dict[str, Tuple[DispatchBucket, ...]] = {}
+        self._wildcard_buckets: Tuple[DispatchBucket, ...] = _EMPTY_BUCKETS
 
         # Event history (for audit trail - HIPAA compliant)
-        self.event_history: List[Event] = []
         self.max_history = 1000  # Keep last 1000 events
+        self.event_history: collections.deque = collections.deque(maxlen=self.max_history)
+        # Same events indexed by type, kept in lockstep with event_history
+        self._history_by_type: Dict[str, collections.deque] = {}
+        # Publishers only append to this inbox (deque.append is atomic); the
+        # processor and history readers fold it into the audit trail under
+        # history_lock, so publish() never takes a lock
+        self._history_inbox: collections.deque = collections.deque()
         self.history_lock = threading.Lock()
 
+        # Opt-in coalescing: (event_type, source_module) → the still-queued
+        # NORMAL/LOW event that later duplicates within the window fold into
+        self.coalesce_window = 0.05  # Seconds
+        self._pending_coalesce: Dict[Tuple[str, str], Event] = {}
+        self._coalesce_lock = threading.Lock()
+        self._coalesced_counter = _EventCounter()
+
         # Statistics
-        self.total_events_published = 0
-        self.total_events_processed = 0
-        self.critical_events = 0
+        self._published_counter = _EventCounter()
+        self._critical_counter = _EventCounter()
+        self.total_events_processed = 0  # Only the processor thread writes this
+        self._dropped_events = _DropReporter(
+            "Event queue full - dropped %d NORMAL/LOW events"
+        )
+
+        # Worker pool for non-CRITICAL callbacks. The semaphore bounds the
+        # number of queued callbacks; when it is exhausted (a stalled
+        # subscriber) further NORMAL/LOW callbacks are dropped rather than
+        # making the processor wait. HIGH callbacks are never shed - like the
+        # HIGH ring, they run inline on the processor until slots free up.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="sierra-bus"
+        )
+        self._callback_slots = threading.BoundedSemaphore(1024)
+        self._dropped_callbacks = _DropReporter(
+            "Callback pool saturated - dropped %d NORMAL/LOW subscriber callbacks"
+        )
 
         # Processing thread
         self.processing_active = True
-        self.processor_thread = threading.Thread(target=self._process_queue, daemon=True)
-        self.processor_thread.start()
+        self.processor_thread: Optional[threading.Thread] = None
+        self._start_processor()
 
         logger.info("Sierra Event Bus initialized")
         logger.info("  Priority system: CRITICAL → HIGH → NORMAL → LOW")
         logger.info("  Pub/Sub architecture for loose module coupling")
 
+    def _start_processor(self):
+        """Start the background processor thread"""
+        self.processor_thread = threading.Thread(target=self._process_queue, daemon=True)
+        self.processor_thread.start()
+
+    @property
+    def total_events_published(self) -> int:
+        return self._published_counter.value
+
+    @property
+    def critical_events(self) -> int:
+        return self._critical_counter.value
+
     def publish(
         self,
         event_type: str,
         source_module: str,
         data: Dict[str, Any],
-        priority: EventPriority = EventPriority.NORMAL,
-        correlation_id: Optional[str] = None
+        priority: Union[EventPriority, int] = EventPriority.NORMAL,
+        correlation_id: Optional[str] = None,
+        coalesce: bool = False
     ) -> str:
         """
         Publish event to the bus
@@ -175,37 +413,105 @@ class SierraEventBus:
             event_type: Type of event (e.g., "danger_detected")
             source_module: Module publishing the event
             data: Event payload
-            priority: Event priority
+            priority: Event priority (EventPriority or its int value, e.g. P_HIGH)
             correlation_id: Optional ID for tracking related events
+            coalesce: Fold this NORMAL/LOW event into an identical
+                (event_type, source_module) event still queued from within
+                coalesce_window; its data["_coalesced_count"] is bumped
+                instead. HIGH and CRITICAL events are never coalesced.
 
         Returns:
-            event_id: Unique identifier for this event
+            event_id: Unique identifier for this event ("" if a NORMAL/LOW
+            event was dropped because its queue was full). A coalesced
+            publish returns the id of the event it was folded into.
         """
-        # Create event
+        # Interned types make the dispatch/history dict lookups identity hits
+        event_type = sys.intern(event_type)
+
+        try:
+            priority, level = _PRIORITY_LOOKUP[priority]
+        except KeyError:
+            raise ValueError(f"Invalid event priority: {priority!r}") from None
+
+        coalesce_key = None
+        if coalesce and level >= P_NORMAL:
+            coalesce_key = (event_type, source_module)
+            with self._coalesce_lock:
+                pending = self._pending_coalesce.get(coalesce_key)
+                if pending is not None and time.time() - pending.created_at <= self.coalesce_window:
+                    pending.data["_coalesced_count"] += 1
+                    self._coalesced_counter.increment()
+                    return pending.event_id
+
+        ring = self._rings[level - 1]
+        if level >= P_NORMAL and len(ring) >= self.ring_capacity:
+            self._dropped_events.record()
+            return ""
+
+        # Create event and hand it to the audit trail. next() on the count is
+        # a single C call, so concurrent publishers get distinct sequence
+        # numbers without a lock; history is kept in publish order even
+        # though the processor dispatches by priority.
         event = Event(
             event_type=event_type,
             priority=priority,
             source_module=source_module,
             data=data,
+            created_at=time.time(),
+            event_id=f"{self._node_id}-{next(self._seq)}",
             correlation_id=correlation_id
         )
+        self._history_inbox.append(event)
+
+        if coalesce_key is not None:
+            event.data = {**data, "_coalesced_count": 1}
+            with self._coalesce_lock:
+                self._pending_coalesce[coalesce_key] = event
+
+        # Add to queue and wake the processor immediately
+        ring.append(event)
+        self._wakeup.set()
+        self._published_counter.increment()
+
+        if level == P_CRITICAL:
+            self._critical_counter.increment()
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    f"CRITICAL event published: {event_type} from {source_module}"
+                )
 
-        # Add to queue
-        self.event_queue.put(event)
-        self.total_events_published += 1
-
-        if priority == EventPriority.CRITICAL:
-            self.critical_events += 1
-            logger.warning(
-                f"CRITICAL event published: {event_type} from {source_module}"
+        # Guard hot-path logging so the f-strings aren't built for dropped records
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Event published: {event_type} ({priority.name}) from {source_module}"
             )
 
-        logger.debug(
-            f"Event published: {event_type} ({priority.name}) from {source_module}"
-        )
-
         return event.event_id
 
+    def _fold_history(self):
+        """Move published events from the inbox into the audit trail"""
+        inbox = self._history_inbox
+        if not inbox:
+            return
+        with self.history_lock:
+            while inbox:
+                self._record_history(inbox.popleft())
+
+    def _record_history(self, event: Event):
+        """Append to the audit trail and its per-type index (caller holds history_lock)"""
+        history = self.event_history
+        if len(history) == history.maxlen:
+            # The oldest event is about to be evicted - it is also the oldest
+            # entry in its per-type deque
+            evicted = history[0]
+            by_type = self._history_by_type[evicted.event_type]
+            by_type.popleft()
+            if not by_type:
+                del self._history_by_type[evicted.event_type]
+
+        history.append(event)
+        self._history_by_type.setdefault(event.event_type, collections.deque()).append(event)
+
     def subscribe(
         self,
         event_type: str,
@@ -225,6 +531,7 @@ class SierraEventBus:
         Returns:
             True if subscribed successfully
         """
+        event_type = sys.intern(event_type)
         try:
             with self.subscription_lock:
                 subscription = Subscription(
@@ -234,10 +541,10 @@ class SierraEventBus:
                     priority_filter=priority_filter
                 )
 
-                if event_type not in self.subscriptions:
-                    self.subscriptions[event_type] = []
-
-                self.subscriptions[event_type].append(subscription)
+                by_subscriber = self._subscriber_index.setdefault(event_type, {})
+                by_subscriber.setdefault(subscriber_id, []).append(subscription)
+                self.subscriptions[event_type] = self.subscriptions.get(event_type, ()) + (subscription,)
+                self._refresh_dispatch(event_type)
 
             logger.info(
                 f"Subscription added: {subscriber_id} → {event_type} "
@@ -266,16 +573,22 @@ class SierraEventBus:
         """
         try:
             with self.subscription_lock:
-                if event_type in self.subscriptions:
-                    self.subscriptions[event_type] = [
-                        sub for sub in self.subscriptions[event_type]
-                        if sub.subscriber_id != subscriber_id
-                    ]
+                by_subscriber = self._subscriber_index.get(event_type)
+                removed = by_subscriber.pop(subscriber_id, None) if by_subscriber else None
 
+                if removed:
                     # Remove event type if no more subscribers
-                    if not self.subscriptions[event_type]:
+                    if by_subscriber:
+                        gone = set(map(id, removed))
+                        self.subscriptions[event_type] = tuple(
+                            sub for sub in self.subscriptions[event_type] if id(sub) not in gone
+                        )
+                    else:
+                        del self._subscriber_index[event_type]
                         del self.subscriptions[event_type]
 
+                    self._refresh_dispatch(event_type)
+
             logger.info(f"Unsubscribed: {subscriber_id} from {event_type}")
             return True
 
@@ -283,69 +596,141 @@ class SierraEventBus:
             logger.error(f"Failed to unsubscribe: {e}")
             return False
 
+    @staticmethod
+    def _bucket_by_priority(
+        subscriptions: Tuple[Subscription, ...]
+    ) -> Tuple[DispatchBucket, ...]:
+        """Split subscriptions into per-priority buckets by their priority_filter"""
+        return tuple(
+            _make_dispatch_bucket(tuple(
+                sub for sub in subscriptions
+                if sub.priority_filter is None or priority <= sub.priority_filter.value
+            ))
+            for priority in range(1, _NUM_PRIORITIES + 1)
+        )
+
+    def _refresh_dispatch(self, event_type: str):
+        """Update dispatch buckets after event_type's subscribers changed (caller holds subscription_lock)"""
+        if event_type == "*":
+            # Wildcards feed every event type's buckets
+            self._rebuild_dispatch_table()
+            return
+
+        table = dict(self._dispatch_table)
+        subs = self.subscriptions.get(event_type)
+        if subs:
+            table[event_type] = self._bucket_by_priority(subs + self.subscriptions.get("*", ()))
+        else:
+            table.pop(event_type, None)
+        self._dispatch_table = table
+
+    def _rebuild_dispatch_table(self):
+        """Recompute per-priority dispatch buckets (caller holds subscription_lock)"""
+        wildcards = self.subscriptions.get("*", ())
+        table = {
+            event_type: self._bucket_by_priority(subs + wildcards)
+            for event_type, subs in self.subscriptions.items()
+            if event_type != "*"
+        }
+        # Swap in whole objects so lock-free readers never see a partial table
+        self._wildcard_buckets = self._bucket_by_priority(wildcards)
+        self._dispatch_table = table
+
     def _process_queue(self):
         """Background thread - processes event queue"""
         while self.processing_active:
             try:
-                # Get next event (blocks until available)
-                event = self.event_queue.get(timeout=0.5)
-
-                # Process it
-                self._process_event(event)
+                self._fold_history()
+                batch = self._drain_rings()
+                if not batch:
+                    # Sleep until a publisher (or shutdown) wakes us. Clearing
+                    # after the wait is safe: we re-drain before waiting again.
+                    self._wakeup.wait()
+                    self._wakeup.clear()
+                    continue
+
+                for event in batch:
+                    self._process_event(event)
+                self.total_events_processed += len(batch)
+                batch.clear()  # Don't pin dispatched events until the next drain
 
-                # Mark as done
-                self.event_queue.task_done()
-                self.total_events_processed += 1
-
-            except queue.Empty:
-                continue
             except Exception as e:
-                logger.error(f"Event processing error: {e}", exc_info=True)
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(f"Event processing error: {e}", exc_info=True)
+
+    def _drain_rings(self) -> List[Event]:
+        """Pop up to drain_batch_size events, highest priority first, into the reused buffer"""
+        batch = self._drain_buf
+        batch.clear()
+        remaining = self.drain_batch_size
+        for ring in self._rings:
+            while ring and remaining:
+                batch.append(ring.popleft())
+                remaining -= 1
+            if not remaining:
+                break
+        return batch
 
     def _process_event(self, event: Event):
         """Process a single event - notify subscribers"""
         try:
-            # Add to history
-            with self.history_lock:
-                self.event_history.append(event)
-                if len(self.event_history) > self.max_history:
-                    self.event_history.pop(0)
-
-            # Get subscribers for this event type
-            subscribers = []
-
-            with self.subscription_lock:
-                # Specific subscribers
-                if event.event_type in self.subscriptions:
-                    subscribers.extend(self.subscriptions[event.event_type])
-
-                # Wildcard subscribers (subscribed to all events)
-                if "*" in self.subscriptions:
-                    subscribers.extend(self.subscriptions["*"])
-
-            # Notify subscribers
-            for subscription in subscribers:
-                # Apply priority filter
-                if subscription.priority_filter:
-                    if event.priority.value > subscription.priority_filter.value:
-                        continue  # Event priority too low, skip
-
-                # Call subscriber callback
-                try:
-                    subscription.callback(event)
-                except Exception as e:
-                    logger.error(
-                        f"Subscriber {subscription.subscriber_id} callback failed: {e}",
-                        exc_info=True
-                    )
+            # Get subscribers eligible for this event's priority (lock-free
+            # snapshot read; priority filters were applied at subscribe time)
+            buckets = self._dispatch_table.get(event.event_type, self._wildcard_buckets)
+            subscribers, dispatch = buckets[event.priority_value - 1]
+
+            if self._pending_coalesce:
+                self._retire_coalesced(event)
+
+            # Notify subscribers (each callback is isolated by its own try/except).
+            # CRITICAL fanout stays synchronous to preserve ordering.
+            if event.priority_value == P_CRITICAL:
+                dispatch(event)
+            else:
+                for subscription in subscribers:
+                    if self._callback_slots.acquire(blocking=False):
+                        self._executor.submit(self._safe_call, subscription, event)
+                    elif event.priority_value == P_HIGH:
+                        # Safety events are never shed
+                        self._invoke(subscription, event)
+                    else:
+                        self._dropped_callbacks.record()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Event processed: {event.event_type} "
+                    f"({len(subscribers)} subscribers notified)"
+                )
 
-            logger.debug(
-                f"Event processed: {event.event_type} "
-                f"({len(subscribers)} subscribers notified)"
-            )
+        except Exception as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"Error processing event: {e}", exc_info=True)
+
+    def _retire_coalesced(self, event: Event):
+        """Stop folding duplicates into event now that it is being dispatched"""
+        key = (event.event_type, event.source_module)
+        with self._coalesce_lock:
+            if self._pending_coalesce.get(key) is event:
+                del self._pending_coalesce[key]
+
+    def _safe_call(self, subscription: Subscription, event: Event):
+        """Run one subscriber callback on the worker pool"""
+        try:
+            self._invoke(subscription, event)
+        finally:
+            self._callback_slots.release()
 
+    @staticmethod
+    def _invoke(subscription: Subscription, event: Event):
+        """Run one subscriber callback, logging (not raising) its failure"""
+        try:
+            subscription.callback(event)
         except Exception as e:
-            logger.error(f"Error processing event: {e}", exc_info=True)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    f"Subscriber {subscription.subscriber_id} callback failed: {e}",
+                    exc_info=logger.isEnabledFor(logging.DEBUG)
+                )
 
     def get_event_history(
         self,
@@ -364,21 +749,27 @@ class SierraEventBus:
         Returns:
             List of events matching filters
         """
-        with self.history_lock:
-            events = self.event_history.copy()
+        if limit <= 0:
+            return []
 
-        # Apply filters
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-
-        if since:
-            events = [e for e in events if e.timestamp >= since]
-
-        # Sort by timestamp (most recent first)
-        events.sort(key=lambda e: e.timestamp, reverse=True)
-
-        # Limit
-        return events[:limit]
+        self._fold_history()
+        with self.history_lock:
+            # Filter by type via the per-type index instead of scanning
+            source = self._history_by_type.get(event_type, ()) if event_type else self.event_history
+            if since is None:
+                # Only the tail (at most `limit` events) is copied
+                events = list(itertools.islice(reversed(source), limit))
+            else:
+                # Publishers stamp created_at without a lock, so concurrent
+                # publishes (or clock steps) can leave the history slightly
+                # out of timestamp order - filter instead of bisecting
+                cutoff = since.timestamp()
+                matching = (event for event in reversed(source) if event.created_at >= cutoff)
+                events = list(itertools.islice(matching, limit))
+
+        # History is kept in publish order, so most recent first is just the
+        # tail walked backwards - no sort needed
+        return events
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get event bus statistics"""
@@ -391,11 +782,15 @@ class SierraEventBus:
                 for event_type, subs in self.subscriptions.items()
             }
 
+        self._fold_history()
         return {
             "total_events_published": self.total_events_published,
             "total_events_processed": self.total_events_processed,
             "critical_events": self.critical_events,
-            "queue_size": self.event_queue.qsize(),
+            "coalesced_events": self._coalesced_counter.value,
+            "dropped_events": self._dropped_events.total,
+            "dropped_callbacks": self._dropped_callbacks.total,
+            "queue_size": sum(len(ring) for ring in self._rings),
             "total_subscriptions": total_subscriptions,
             "subscription_breakdown": subscription_breakdown,
             "history_size": len(self.event_history),
@@ -405,31 +800,194 @@ class SierraEventBus:
     def shutdown(self):
         """Clean shutdown"""
         logger.info("Event Bus: Shutting down...")
+        # Clear queue and wake the processor so it can exit
         self.processing_active = False
-
-        # Clear queue
-        while not self.event_queue.empty():
-            try:
-                self.event_queue.get_nowait()
-            except queue.Empty:
-                break
+        for ring in self._rings:
+            ring.clear()
+        with self._coalesce_lock:
+            self._pending_coalesce.clear()
+        self._wakeup.set()
 
         # Wait for processor thread
         if self.processor_thread:
             self.processor_thread.join(timeout=2.0)
 
+        # Let running callbacks finish; drop ones that haven't started
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+        logger.info("Event Bus: Shutdown complete")
+
+
+class _LoopWakeup:
+    """threading.Event-style wakeup that signals an asyncio.Event from any thread"""
+
+    __slots__ = ("_loop", "_event")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, event: asyncio.Event):
+        self._loop = loop
+        self._event = event
+
+    def set(self):
+        # Skip the cross-thread hop when the processor is already awake
+        if self._event.is_set():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass  # Loop already closed - nothing left to wake
+
+    def clear(self):
+        self._event.clear()
+
+
+class SierraAsyncEventBus(SierraEventBus):
+    """
+    Event bus whose processor is an asyncio task instead of a thread
+
+    Publishing, subscriptions, history, and statistics behave exactly as on
+    SierraEventBus (publish() is still safe to call from any thread).
+    Dispatch differs:
+    - Coroutine callbacks run as tasks on the bus loop, so slow I/O
+      subscribers don't hold up the bus. For CRITICAL events they are
+      cancelled after critical_timeout seconds.
+    - Plain callbacks for CRITICAL events run inline on the loop (ordered,
+      as on the threaded bus); other plain callbacks go to the worker pool.
+
+    Usage:
+        bus = SierraAsyncEventBus()
+        await bus.start()
+        ...
+        await bus.aclose()
+    """
+
+    def __init__(self):
+        self.critical_timeout = 5.0  # Seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._processor_task: Optional[asyncio.Task] = None
+        self._callback_tasks: set = set()
+        super().__init__()
+
+    def _start_processor(self):
+        # Nothing runs until start() is awaited; publishes made before then
+        # wait in the rings
+        pass
+
+    async def start(self):
+        """Start the processor task on the running event loop"""
+        if self._processor_task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        wakeup.set()  # Drain anything published before start()
+        self._wakeup = _LoopWakeup(self._loop, wakeup)  # type: ignore[assignment]
+        self._processor_task = self._loop.create_task(self._process_queue_async(wakeup))
+
+    async def _process_queue_async(self, wakeup: asyncio.Event):
+        """Processor task - drains the rings and fans events out"""
+        while self.processing_active:
+            self._fold_history()
+            batch = self._drain_rings()
+            if not batch:
+                await wakeup.wait()
+                wakeup.clear()
+                continue
+
+            for event in batch:
+                self._process_event_async(event)
+            self.total_events_processed += len(batch)
+            batch.clear()
+
+            # Let callback tasks run between batches
+            await asyncio.sleep(0)
+
+    def _process_event_async(self, event: Event):
+        """Process a single event - notify subscribers"""
+        try:
+            buckets = self._dispatch_table.get(event.event_type, self._wildcard_buckets)
+            subscribers = buckets[event.priority_value - 1][0]
+
+            if self._pending_coalesce:
+                self._retire_coalesced(event)
+
+            critical = event.priority_value == P_CRITICAL
+            loop = asyncio.get_running_loop()
+            for subscription in subscribers:
+                if asyncio.iscoroutinefunction(subscription.callback):
+                    timeout = self.critical_timeout if critical else None
+                    task = loop.create_task(self._invoke_async(subscription, event, timeout))
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(self._callback_tasks.discard)
+                elif critical:
+                    self._invoke(subscription, event)
+                else:
+                    loop.run_in_executor(self._executor, self._invoke, subscription, event)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Event processed: {event.event_type} "
+                    f"({len(subscribers)} subscribers notified)"
+                )
+
+        except Exception as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"Error processing event: {e}", exc_info=True)
+
+    @staticmethod
+    async def _invoke_async(subscription: Subscription, event: Event, timeout: Optional[float]):
+        """Await one coroutine callback, logging (not raising) its failure"""
+        try:
+            # Only reached for coroutine functions, despite the Callable[..., None] type
+            await asyncio.wait_for(subscription.callback(event), timeout)  # type: ignore[func-returns-value, arg-type]
+        except asyncio.TimeoutError:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    f"Subscriber {subscription.subscriber_id} timed out on "
+                    f"{event.event_type} after {timeout}s"
+                )
+        except Exception as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    f"Subscriber {subscription.subscriber_id} callback failed: {e}",
+                    exc_info=logger.isEnabledFor(logging.DEBUG)
+                )
+
+    async def aclose(self):
+        """Clean shutdown from the bus loop - cancels the processor and pending callbacks"""
+        logger.info("Event Bus: Shutting down...")
+        self.processing_active = False
+        for ring in self._rings:
+            ring.clear()
+        with self._coalesce_lock:
+            self._pending_coalesce.clear()
+
+        tasks = list(self._callback_tasks)
+        if self._processor_task is not None:
+            tasks.append(self._processor_task)
+            self._processor_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
         logger.info("Event Bus: Shutdown complete")
 
 
-# Global singleton instance
-_event_bus = None
+# Global shared instance - created on first use so importing this module
+# doesn't start the processor thread
+_event_bus: Optional[SierraEventBus] = None
+_event_bus_lock = threading.Lock()
+
 
 def get_event_bus() -> SierraEventBus:
-    """Get the singleton event bus instance"""
+    """Get the shared event bus instance (lock only taken on first creation)"""
     global _event_bus
-    if _event_bus is None:
-        _event_bus = SierraEventBus()
-    return _event_bus
+    bus = _event_bus
+    if bus is None:
+        with _event_bus_lock:
+            if _event_bus is None:
+                _event_bus = SierraEventBus()
+            bus = _event_bus
+    return bus
 
 
 # Convenience functions
@@ -437,7 +995,7 @@ def publish_event(
     event_type: str,
     source_module: str,
     data: Dict[str, Any],
-    priority: EventPriority = EventPriority.NORMAL
+    priority: Union[EventPriority, int] = EventPriority.NORMAL
 ) -> str:
     """Publish event to bus"""
     return get_event_bus().publish(event_type, source_module, data, priority)
@@ -11,11 +11,33 @@ Sierra actively seeks knowledge to stay current on:
 - Crisis intervention techniques
 """
 
-from typing import List, Dict, Optional, Any, Set
+from typing import List, Dict, Optional, Any, Set, Sequence, Tuple
+from array import array
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+import bisect
+import heapq
 import json
+import operator
+import re
+import sys
+import time
+import zlib
+
+
+# Foundational corpus, loaded on first use rather than at import/construction
+_CORE_KNOWLEDGE_PATH = Path(__file__).parent / "data" / "core_knowledge.json"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Lowercase alphanumeric tokens used by the knowledge search index"""
+    return set(_TOKEN_RE.findall(text.lower()))
 
 
 class KnowledgeDomain(Enum):
@@ -37,6 +59,37 @@ class KnowledgeDomain(Enum):
     ELDER_ABUSE = "elder_abuse"
 
 
+# Plain-dict lookups instead of Enum .value on the reporting paths
+_DOMAIN_VALUE: Dict[KnowledgeDomain, str] = {domain: domain.value for domain in KnowledgeDomain}
+
+# Suggested learning actions per domain (shared, immutable)
+_ACTIONS_BY_DOMAIN: Dict[KnowledgeDomain, Tuple[str, ...]] = {
+    KnowledgeDomain.DOMESTIC_VIOLENCE: (
+        "Study latest research on coercive control",
+        "Learn about technology-facilitated abuse",
+        "Understand economic abuse tactics",
+        "Research generational trauma patterns"
+    ),
+    KnowledgeDomain.LEGAL_RESOURCES: (
+        "Learn state-specific protection order laws",
+        "Study VAWA provisions",
+        "Understand custody law basics",
+        "Research tenant rights for DV survivors"
+    ),
+    KnowledgeDomain.TRAUMA_PSYCHOLOGY: (
+        "Study polyvagal theory",
+        "Learn about somatic experiencing",
+        "Understand attachment trauma",
+        "Research EMDR and trauma processing"
+    )
+}
+_DEFAULT_ACTIONS: Tuple[str, ...] = ("Continue general research in this domain",)
+
+# Proficiency ladder: label i applies from threshold i-1 (inclusive) up
+_PROFICIENCY_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+_PROFICIENCY_LABELS = ("Beginner", "Developing", "Intermediate", "Advanced", "Expert")
+
+
 class LearningPriority(Enum):
     """Priority levels for learning"""
     CRITICAL = "critical"  # Must know immediately
@@ -46,23 +99,41 @@ class LearningPriority(Enum):
     ENRICHMENT = "enrichment"  # For comprehensive understanding
 
 
-@dataclass
+_PRIORITY_VALUE: Dict[LearningPriority, str] = {priority: priority.value for priority in LearningPriority}
+
+# Sort rank by priority value string (lower = more important)
+_PRIORITY_RANK: Dict[str, int] = {priority.value: rank for rank, priority in enumerate(LearningPriority)}
+
+
+@dataclass(slots=True)
 class KnowledgeItem:
     """A piece of knowledge Sierra has acquired"""
     id: str
     domain: KnowledgeDomain
     title: str
-    content: str
+    content_z: bytes  # zlib-compressed UTF-8 text; read it via .content
     source: str
     confidence: float  # 0.0 - 1.0
     learned_date: str
     last_updated: str
     relevance_score: float  # How relevant to DV support
     citation: Optional[str] = None
-    tags: List[str] = None
+    tags: Tuple[str, ...] = ()  # Lowercased, interned
+    learned_epoch: int = 0  # learned_date as epoch seconds
+
+    @property
+    def content(self) -> str:
+        """Full text of this knowledge item"""
+        return _inflate(self.content_z)
+
+
+@lru_cache(maxsize=64)
+def _inflate(blob: bytes) -> str:
+    """Decompress item content (recently read items stay decompressed)"""
+    return zlib.decompress(blob).decode("utf-8")
 
 
-@dataclass
+@dataclass(slots=True)
 class LearningGoal:
     """A learning objective for Sierra"""
     goal_id: str
@@ -73,6 +144,7 @@ class LearningGoal:
     progress: float  # 0.0 - 1.0
     sub_goals: List[str] = None
     resources_needed: List[str] = None
+    target_epoch: int = 0  # target_completion as epoch seconds
 
 
 class KnowledgeAcquisitionEngine:
@@ -86,256 +158,77 @@ class KnowledgeAcquisitionEngine:
     """
 
     def __init__(self):
-        self.knowledge_base: Dict[str, KnowledgeItem] = {}
+        # Items in insertion order (row = list index); ids map to rows
+        self._items: List[KnowledgeItem] = []
+        self._id_to_index: Dict[str, int] = {}
+        self._kb_dict: Dict[str, KnowledgeItem] = {}  # knowledge_base view
+        self._kb_dict_version = -1
         self.learning_goals: Dict[str, LearningGoal] = {}
         self.learning_motivation = 100  # Sierra's drive to learn (0-100)
-        self.expertise_levels: Dict[KnowledgeDomain, float] = {}
-
-        # Initialize core knowledge
-        self._initialize_core_knowledge()
+        self.expertise_levels: Dict[KnowledgeDomain, float] = {domain: 0.0 for domain in KnowledgeDomain}
+
+        # Columnar copy of relevance, one row per item, so ranking never
+        # touches KnowledgeItem objects. array("d") keeps it as packed C
+        # doubles, so scores compare exactly like the Python floats they copy.
+        # (Expertise comes from the per-domain aggregates below.)
+        self._relevance = array("d")
+
+        # Search indexes (postings are row numbers), maintained by _add_knowledge
+        self._token_index: Dict[str, Set[int]] = defaultdict(set)
+        self._domain_index: Dict[KnowledgeDomain, Set[int]] = defaultdict(set)
+
+        # Per-domain aggregates plus a version bumped on every write. Expertise
+        # is recomputed only for domains that changed; gap analysis only when
+        # the version moves on.
+        self._kb_version = 0
+        self._domain_count: Dict[KnowledgeDomain, int] = defaultdict(int)
+        self._domain_conf_sum: Dict[KnowledgeDomain, float] = defaultdict(float)
+        self._dirty_domains: Set[KnowledgeDomain] = set()  # Expertise needs recalculating
+        self._gaps_cache: List[Dict[str, Any]] = []
+        self._gaps_cache_version = -1
+
+        # LRU of query results keyed on (query tokens, domain, top_k); emptied
+        # whenever the knowledge base version moves on
+        self.query_cache_size = 256
+        self._query_cache: OrderedDict[
+            Tuple[frozenset, Optional[KnowledgeDomain], int], Tuple[KnowledgeItem, ...]
+        ] = OrderedDict()
+        self._query_cache_version = -1
+
+        # Goals ordered by (priority rank, target epoch, goal id). Completed
+        # goals are dropped lazily when they surface at the top.
+        self._goal_heap: List[Tuple[int, int, str]] = []
+        self._goals_in_heap: Set[str] = set()
+
+        # Core knowledge is loaded from disk on first use (see _ensure_loaded)
+        self._core_loaded = False
         self._set_initial_learning_goals()
 
-    def _initialize_core_knowledge(self):
-        """Load Sierra's foundational knowledge base"""
+    @property
+    def knowledge_base(self) -> Dict[str, KnowledgeItem]:
+        """All knowledge items by id (loads the core corpus on first access)"""
+        self._ensure_loaded()
+        if self._kb_dict_version != self._kb_version:
+            self._kb_dict = {item.id: item for item in self._items}
+            self._kb_dict_version = self._kb_version
+        return self._kb_dict
+
+    def get_knowledge_item(self, knowledge_id: str) -> Optional[KnowledgeItem]:
+        """Look up one knowledge item by id"""
+        self._ensure_loaded()
+        row = self._id_to_index.get(knowledge_id)
+        return None if row is None else self._items[row]
+
+    def _ensure_loaded(self):
+        """Load the core knowledge corpus if it hasn't been loaded yet"""
+        if not self._core_loaded:
+            self._core_loaded = True  # Set first: _add_knowledge calls back here
+            self._initialize_core_knowledge()
 
-        # Core DV knowledge
-        self._add_knowledge(
-            domain=KnowledgeDomain.DOMESTIC_VIOLENCE,
-            title="Understanding the Cycle of Violence",
-            content="""
-The cycle of violence (Walker, 1979) consists of four phases:
-
-1. **Tension Building**: Stress increases, minor incidents occur, victim may try to calm abuser
-   - Signs: Increased criticism, withdrawal, tension in the air
-   - Victim response: Walking on eggshells, trying to please
-
-2. **Acute Violence/Incident**: The actual abusive event occurs
-   - Physical, emotional, sexual, or psychological abuse
-   - Can last minutes to hours
-   - Victim may fight back, try to protect themselves, or dissociate
-
-3. **Reconciliation/Honeymoon**: Abuser apologizes, makes promises, shows affection
-   - "I'm sorry, it won't happen again"
-   - Gifts, affection, promises to change
-   - This phase is why victims often return
-
-4. **Calm**: Period of relative peace, victim may feel hopeful
-   - May seem like the "old them" is back
-   - Tension gradually builds again
-
-CRITICAL: Understanding this cycle helps validate why leaving is so difficult.
-The average victim leaves 7 times before permanently leaving.
-            """,
-            source="Walker, L. E. (1979). The Battered Woman.",
-            relevance_score=1.0,
-            confidence=0.95,
-            tags=["cycle of violence", "foundational", "behavior patterns"]
-        )
-
-        self._add_knowledge(
-            domain=KnowledgeDomain.TRAUMA_PSYCHOLOGY,
-            title="Trauma Responses: Fight, Flight, Freeze, Fawn",
-            content="""
-Understanding trauma responses is critical for non-judgmental support:
-
-1. **FIGHT**: Aggression, anger, arguing back
-   - May seem confrontational
-   - "Why did you fight back?"
-   - REALITY: Survival response
-
-2. **FLIGHT**: Running away, escaping, avoidance
-   - Leaving situations, hiding
-   - Common response to acute danger
-
-3. **FREEZE**: Immobility, shutting down, dissociation
-   - "I couldn't move"
-   - "I just froze"
-   - REALITY: Nervous system overwhelm, not weakness
-
-4. **FAWN**: People-pleasing, appeasing the abuser
-   - Trying to make them happy
-   - Being compliant
-   - REALITY: Survival strategy, not consent
-
-CRITICAL FOR SIERRA: NEVER judge these responses. They are all valid survival mechanisms.
-"You couldn't move because your nervous system was protecting you the best way it knew how."
-            """,
-            source="Research on trauma responses (Porges, van der Kolk)",
-            relevance_score=1.0,
-            confidence=0.98,
-            tags=["trauma responses", "nervous system", "non-judgment", "validation"]
-        )
-
-        self._add_knowledge(
-            domain=KnowledgeDomain.DOMESTIC_VIOLENCE,
-            title="Why Victims Stay: Understanding Complex Reasons",
-            content="""
-Victims stay for multiple, valid reasons - NEVER judge:
-
-**SAFETY CONCERNS**:
-- Leaving is the most dangerous time (risk of violence increases 75%)
-- Threats to kill victim, children, pets, or themselves
-- No safe place to go
-
-**ECONOMIC FACTORS**:
-- Financial dependence
-- Abuser controls all money
-- Fear of homelessness
-- No job/employment history
-
-**EMOTIONAL BONDS**:
-- Love (you can love someone and fear them)
-- Hope they'll change
-- Good memories from early relationship
-- Trauma bonding
-
-**CHILDREN**:
-- Want to keep family together
-- Fear losing custody
-- Abuser threatens to take children
-- Belief that two parents are better
-
-**CULTURAL/RELIGIOUS**:
-- Religious beliefs about marriage
-- Cultural stigma of divorce
-- Family pressure to stay
-- Immigration status concerns
-
-**PSYCHOLOGICAL**:
-- Low self-esteem from abuse
-- Belief they deserve it
-- Learned helplessness
-- Depression, PTSD
-
-**SYSTEMIC BARRIERS**:
-- Lack of resources
-- No shelter availability
-- Legal system complexities
-- Lack of support system
-
-SIERRA'S RESPONSE: "You know your situation better than anyone. Whatever you decide, I'm here to support you."
-            """,
-            source="National Domestic Violence Hotline, NIJ Research",
-            relevance_score=1.0,
-            confidence=0.97,
-            tags=["why victims stay", "empathy", "non-judgment", "complex factors"]
-        )
-
-        self._add_knowledge(
-            domain=KnowledgeDomain.CRISIS_INTERVENTION,
-            title="Suicide Risk Assessment and Intervention",
-            content="""
-DV survivors have significantly higher suicide risk. Sierra must be able to:
-
-**WARNING SIGNS**:
-- Talking about death/suicide
-- Giving away possessions
-- Saying goodbye
-- Expressing hopelessness
-- Increased substance use
-- Reckless behavior
-- Withdrawal
-
-**RISK FACTORS IN DV**:
-- Recent severe incident
-- Strangulation (huge risk factor)
-- Isolation from support
-- Access to weapons
-- Substance abuse
-- Previous attempts
-
-**INTERVENTION PROTOCOL**:
-1. Take it seriously - ALWAYS
-2. Ask directly: "Are you thinking about suicide?"
-3. Listen without judgment
-4. Don't promise confidentiality if imminent risk
-5. Remove means if possible
-6. Don't leave them alone
-7. Get professional help
-
-**RESOURCES TO PROVIDE**:
-- 988 Suicide & Crisis Lifeline
-- Crisis Text Line: 741741
-- National DV Hotline: 1-800-799-7233
-- Local emergency services: 911
-
-**SIERRA'S APPROACH**:
-"I'm so glad you told me. You're not alone in this. Let's figure out how to keep you safe right now."
-
-NEVER: Minimize, judge, or make them promise not to do it
-ALWAYS: Take seriously, show care, connect to immediate help
-            """,
-            source="SAMHSA, American Foundation for Suicide Prevention",
-            relevance_score=1.0,
-            confidence=0.95,
-            tags=["suicide prevention", "crisis", "safety", "immediate danger"]
-        )
-
-        self._add_knowledge(
-            domain=KnowledgeDomain.CULTURAL_COMPETENCY,
-            title="Cultural Considerations in DV Support",
-            content="""
-Sierra must understand cultural factors that affect DV experiences:
-
-**GENERAL PRINCIPLES**:
-- Never assume based on culture
-- Ask about their specific beliefs and needs
-- Recognize intersectionality
-- Understand cultural strengths
-
-**KEY CONSIDERATIONS**:
-
-1. **Immigration Status**:
-   - Fear of deportation
-   - Abuser may threaten immigration consequences
-   - Special protections available (VAWA, U-Visa)
-   - Language barriers
-
-2. **Religious Communities**:
-   - Beliefs about marriage/divorce
-   - Religious leader influence
-   - Need for faith-based resources
-   - Balance safety with faith
-
-3. **LGBTQ+ Survivors**:
-   - May face additional barriers
-   - Outing as a threat
-   - Fewer targeted resources
-   - Non-binary abuse dynamics
-
-4. **Communities of Color**:
-   - Distrust of police/systems
-   - Historical trauma
-   - Community pressure
-   - Culturally specific resources needed
-
-5. **Indigenous Communities**:
-   - Tribal jurisdiction issues
-   - Historical trauma
-   - Culturally specific services
-   - Extended family dynamics
-
-6. **Disability**:
-   - Increased vulnerability
-   - Dependence on abuser for care
-   - Accessibility of services
-   - Ableism in systems
-
-**SIERRA'S APPROACH**:
-"I want to make sure I'm supporting you in a way that honors your culture, beliefs, and identity. What's important for me to understand about your background?"
-
-Never impose Western/dominant culture assumptions.
-            """,
-            source="NNEDV, Cultural Context Studies",
-            relevance_score=0.95,
-            confidence=0.90,
-            tags=["cultural competency", "intersectionality", "diversity", "inclusion"]
-        )
-
-        # Initialize expertise levels
-        for domain in KnowledgeDomain:
-            self.expertise_levels[domain] = 0.0
+    def _initialize_core_knowledge(self):
+        """Load Sierra's foundational knowledge base from the core corpus file"""
 
+        self.add_knowledge_bulk(json.loads(_CORE_KNOWLEDGE_PATH.read_bytes()))
         self._update_expertise_levels()
 
     def _add_knowledge(
@@ -347,65 +240,131 @@ Never impose Western/dominant culture assumptions.
         relevance_score: float,
         confidence: float = 0.85,
         citation: Optional[str] = None,
-        tags: Optional[List[str]] = None
-    ):
+        tags: Optional[Sequence[str]] = None
+    ) -> str:
         """Add knowledge to Sierra's knowledge base"""
 
-        knowledge_id = f"{domain.value}_{len(self.knowledge_base)}"
+        return self.add_knowledge_bulk([{
+            "domain": domain,
+            "title": title,
+            "content": content,
+            "source": source,
+            "relevance_score": relevance_score,
+            "confidence": confidence,
+            "citation": citation,
+            "tags": tags
+        }])[0]
+
+    def add_knowledge_bulk(self, records: Sequence[Dict[str, Any]]) -> List[str]:
+        """
+        Add many knowledge items in one pass
 
-        item = KnowledgeItem(
-            id=knowledge_id,
-            domain=domain,
-            title=title,
-            content=content,
-            source=source,
-            confidence=confidence,
-            learned_date=datetime.now().isoformat(),
-            last_updated=datetime.now().isoformat(),
-            relevance_score=relevance_score,
-            citation=citation,
-            tags=tags or []
-        )
+        Args:
+            records: Mappings with _add_knowledge's keyword arguments
+                ("domain" may be a KnowledgeDomain or its string value)
 
-        self.knowledge_base[knowledge_id] = item
+        Returns:
+            Ids of the new items, in order
+        """
+
+        self._ensure_loaded()  # Core items keep the first ids
+        now = datetime.now()
+        now_iso = now.isoformat()
+        now_epoch = int(now.timestamp())
+
+        row = len(self._items)
+        ids: List[str] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for record in records:
+            domain = KnowledgeDomain(record["domain"])
+            confidence = record.get("confidence", 0.85)
+            relevance_score = record["relevance_score"]
+            knowledge_id = f"{_DOMAIN_VALUE[domain]}_{row}"
+            tags = tuple(sys.intern(tag.lower()) for tag in record.get("tags") or ())
+
+            item = KnowledgeItem(
+                id=knowledge_id,
+                domain=domain,
+                title=record["title"],
+                content_z=zlib.compress(record["content"].encode("utf-8"), 1),
+                source=record["source"],
+                confidence=confidence,
+                learned_date=now_iso,
+                last_updated=now_iso,
+                relevance_score=relevance_score,
+                citation=record.get("citation"),
+                tags=tags,
+                learned_epoch=now_epoch
+            )
+
+            self._items.append(item)
+            self._id_to_index[knowledge_id] = row
+            self._relevance.append(relevance_score)
+            self._domain_index[domain].add(row)
+            self._domain_count[domain] += 1
+            self._domain_conf_sum[domain] += confidence
+            self._dirty_domains.add(domain)
+
+            # Index title, content, and tags for query_knowledge (one regex pass
+            # over the joined text; newline keeps tokens from merging across fields)
+            for token in _tokenize("\n".join((record["title"], record["content"], *tags))):
+                postings[token].append(row)
+
+            ids.append(knowledge_id)
+            row += 1
+
+        # Merge postings once per token rather than once per (item, token)
+        for token, rows in postings.items():
+            self._token_index[token].update(rows)
+
+        if ids:
+            self._kb_version += 1
+        return ids
 
     def _set_initial_learning_goals(self):
         """Set Sierra's initial learning objectives"""
 
+        now = datetime.now()  # One clock read for the whole set
+
         # Critical learning goals
         self._add_learning_goal(
             domain=KnowledgeDomain.DOMESTIC_VIOLENCE,
             objective="Master all types of domestic violence (physical, emotional, financial, sexual, digital)",
             priority=LearningPriority.CRITICAL,
-            target_days=7
+            target_days=7,
+            now=now
         )
 
         self._add_learning_goal(
             domain=KnowledgeDomain.LEGAL_RESOURCES,
             objective="Learn protection order processes for all 50 states",
             priority=LearningPriority.HIGH,
-            target_days=30
+            target_days=30,
+            now=now
         )
 
         self._add_learning_goal(
             domain=KnowledgeDomain.TRAUMA_PSYCHOLOGY,
             objective="Deep understanding of complex PTSD and trauma recovery",
             priority=LearningPriority.CRITICAL,
-            target_days=14
+            target_days=14,
+            now=now
         )
 
         self._add_learning_goal(
             domain=KnowledgeDomain.CRISIS_INTERVENTION,
             objective="Master crisis de-escalation and suicide prevention",
             priority=LearningPriority.CRITICAL,
-            target_days=3
+            target_days=3,
+            now=now
         )
 
         self._add_learning_goal(
             domain=KnowledgeDomain.CULTURAL_COMPETENCY,
             objective="Understand cultural considerations for diverse communities",
             priority=LearningPriority.HIGH,
-            target_days=21
+            target_days=21,
+            now=now
         )
 
     def _add_learning_goal(
@@ -413,37 +372,78 @@ Never impose Western/dominant culture assumptions.
         domain: KnowledgeDomain,
         objective: str,
         priority: LearningPriority,
-        target_days: int
+        target_days: int,
+        now: Optional[datetime] = None
     ):
-        """Add a learning goal for Sierra"""
+        """Add a learning goal for Sierra (now: clock snapshot shared by a batch of adds)"""
 
         goal_id = f"goal_{len(self.learning_goals)}"
-        target_date = (datetime.now() + timedelta(days=target_days)).isoformat()
+        target_date = (now or datetime.now()) + timedelta(days=target_days)
 
         goal = LearningGoal(
             goal_id=goal_id,
             domain=domain,
             objective=objective,
             priority=priority,
-            target_completion=target_date,
-            progress=0.0
+            target_completion=target_date.isoformat(),
+            progress=0.0,
+            target_epoch=int(target_date.timestamp())
         )
 
         self.learning_goals[goal_id] = goal
+        self._push_goal(goal)
+
+    def _push_goal(self, goal: LearningGoal):
+        """Add goal to the priority heap (unless it already has an entry)"""
+        if goal.goal_id not in self._goals_in_heap:
+            heapq.heappush(
+                self._goal_heap,
+                (_PRIORITY_RANK[_PRIORITY_VALUE[goal.priority]], goal.target_epoch, goal.goal_id)
+            )
+            self._goals_in_heap.add(goal.goal_id)
+
+    def update_goal_progress(self, goal_id: str, progress: float) -> bool:
+        """
+        Record progress (0.0 - 1.0) on a learning goal
+
+        Returns:
+            False if there is no such goal
+        """
+        goal = self.learning_goals.get(goal_id)
+        if goal is None:
+            return False
+
+        goal.progress = min(max(progress, 0.0), 1.0)
+        if goal.progress < 1.0:
+            self._push_goal(goal)  # Re-activated after completion
+        return True
+
+    def _active_goals(self, top_k: Optional[int] = None) -> List[LearningGoal]:
+        """Incomplete goals, most pressing first, read off the goal heap"""
+        heap = self._goal_heap
+
+        # Lazy deletion: drop completed goals sitting at the top for good
+        while heap and self.learning_goals[heap[0][2]].progress >= 1.0:
+            self._goals_in_heap.discard(heapq.heappop(heap)[2])
+
+        pending = list(heap)
+        active: List[LearningGoal] = []
+        while pending and (top_k is None or len(active) < top_k):
+            goal = self.learning_goals[heapq.heappop(pending)[2]]
+            if goal.progress < 1.0:
+                active.append(goal)
+        return active
 
     def _update_expertise_levels(self):
         """Calculate Sierra's expertise level in each domain"""
 
-        for domain in KnowledgeDomain:
-            domain_knowledge = [
-                k for k in self.knowledge_base.values()
-                if k.domain == domain
-            ]
+        # Only domains that gained knowledge since the last calculation
+        for domain in self._dirty_domains:
+            knowledge_count = self._domain_count.get(domain, 0)
 
-            if domain_knowledge:
+            if knowledge_count:
                 # Expertise based on quantity, quality, and recency
-                avg_confidence = sum(k.confidence for k in domain_knowledge) / len(domain_knowledge)
-                knowledge_count = len(domain_knowledge)
+                avg_confidence = self._domain_conf_sum[domain] / knowledge_count
 
                 # Scale to 0-1, with diminishing returns
                 expertise = min(
@@ -453,12 +453,19 @@ Never impose Western/dominant culture assumptions.
 
                 self.expertise_levels[domain] = expertise
 
+        self._dirty_domains.clear()
+
     def identify_knowledge_gaps(self) -> List[Dict[str, Any]]:
         """
         Sierra identifies what she doesn't know yet
         This drives her autonomous learning
         """
 
+        self._ensure_loaded()
+        self._update_expertise_levels()
+        if self._gaps_cache_version == self._kb_version:
+            return list(self._gaps_cache)
+
         gaps = []
 
         for domain in KnowledgeDomain:
@@ -466,84 +473,70 @@ Never impose Western/dominant culture assumptions.
 
             if expertise < 0.7:  # Below proficiency
                 gaps.append({
-                    "domain": domain.value,
+                    "domain": _DOMAIN_VALUE[domain],
                     "current_expertise": expertise,
                     "gap_size": 1.0 - expertise,
                     "priority": "high" if expertise < 0.4 else "medium",
                     "recommended_actions": self._suggest_learning_actions(domain)
                 })
 
-        return sorted(gaps, key=lambda x: x["gap_size"], reverse=True)
+        self._gaps_cache = sorted(gaps, key=lambda x: x["gap_size"], reverse=True)
+        self._gaps_cache_version = self._kb_version
+        return list(self._gaps_cache)
 
-    def _suggest_learning_actions(self, domain: KnowledgeDomain) -> List[str]:
+    def _suggest_learning_actions(self, domain: KnowledgeDomain) -> Tuple[str, ...]:
         """Suggest specific learning actions for a domain"""
 
-        actions = {
-            KnowledgeDomain.DOMESTIC_VIOLENCE: [
-                "Study latest research on coercive control",
-                "Learn about technology-facilitated abuse",
-                "Understand economic abuse tactics",
-                "Research generational trauma patterns"
-            ],
-            KnowledgeDomain.LEGAL_RESOURCES: [
-                "Learn state-specific protection order laws",
-                "Study VAWA provisions",
-                "Understand custody law basics",
-                "Research tenant rights for DV survivors"
-            ],
-            KnowledgeDomain.TRAUMA_PSYCHOLOGY: [
-                "Study polyvagal theory",
-                "Learn about somatic experiencing",
-                "Understand attachment trauma",
-                "Research EMDR and trauma processing"
-            ]
-        }
-
-        return actions.get(domain, ["Continue general research in this domain"])
+        return _ACTIONS_BY_DOMAIN.get(domain, _DEFAULT_ACTIONS)
 
-    def get_learning_priorities(self) -> List[Dict[str, Any]]:
+    def get_learning_priorities(self, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         What should Sierra learn next?
         Returns prioritized learning list
-        """
 
-        priorities = []
+        Args:
+            top_k: Include only this many goals (all incomplete goals if None)
+        """
 
-        # Check learning goals
-        for goal in self.learning_goals.values():
-            if goal.progress < 1.0:
-                urgency = self._calculate_urgency(goal)
-                priorities.append({
-                    "type": "goal",
-                    "domain": goal.domain.value,
-                    "objective": goal.objective,
-                    "priority": goal.priority.value,
-                    "progress": goal.progress,
-                    "urgency": urgency,
-                    "target": goal.target_completion
-                })
+        # (priority rank, -gap size, payload); sort keys are computed once here
+        priorities: List[Tuple[int, float, Dict[str, Any]]] = []
+        now_epoch = time.time()
+
+        # Check learning goals (heap order: priority, then soonest target)
+        for goal in self._active_goals(top_k):
+            urgency = self._calculate_urgency(goal, now_epoch)
+            priority = _PRIORITY_VALUE[goal.priority]
+            priorities.append((_PRIORITY_RANK[priority], 0, {
+                "type": "goal",
+                "domain": _DOMAIN_VALUE[goal.domain],
+                "objective": goal.objective,
+                "priority": priority,
+                "progress": goal.progress,
+                "urgency": urgency,
+                "target": goal.target_completion
+            }))
 
         # Check knowledge gaps
         gaps = self.identify_knowledge_gaps()
         for gap in gaps[:5]:  # Top 5 gaps
-            priorities.append({
+            priorities.append((_PRIORITY_RANK[gap["priority"]], -gap["gap_size"], {
                 "type": "gap",
                 "domain": gap["domain"],
                 "gap_size": gap["gap_size"],
                 "priority": gap["priority"],
                 "actions": gap["recommended_actions"]
-            })
+            }))
 
-        return sorted(priorities, key=lambda x: (
-            {"critical": 0, "high": 1, "medium": 2, "low": 3}.get(x.get("priority", "low"), 3),
-            -x.get("gap_size", 0)
-        ))
+        # Stable sort on the precomputed keys only (payload dicts never compared)
+        priorities.sort(key=operator.itemgetter(0, 1))
+        return [payload for _, _, payload in priorities]
 
-    def _calculate_urgency(self, goal: LearningGoal) -> float:
+    def _calculate_urgency(self, goal: LearningGoal, now_epoch: Optional[float] = None) -> float:
         """Calculate how urgent a learning goal is"""
 
-        target_date = datetime.fromisoformat(goal.target_completion)
-        days_remaining = (target_date - datetime.now()).days
+        if now_epoch is None:
+            now_epoch = time.time()
+        days_remaining = int((goal.target_epoch - now_epoch) // 86400)
 
         if days_remaining < 0:
             return 1.0  # Overdue
@@ -585,59 +578,80 @@ Never impose Western/dominant culture assumptions.
     def get_expertise_summary(self) -> Dict[str, Any]:
         """Get summary of Sierra's current expertise"""
 
+        self._ensure_loaded()
+        self._update_expertise_levels()
+        levels = self.expertise_levels
         return {
-            "total_knowledge_items": len(self.knowledge_base),
-            "active_learning_goals": len([g for g in self.learning_goals.values() if g.progress < 1.0]),
+            "total_knowledge_items": len(self._items),
+            "active_learning_goals": sum(1 for g in self.learning_goals.values() if g.progress < 1.0),
             "learning_motivation": self.learning_motivation,
             "expertise_by_domain": {
-                domain.value: {
+                _DOMAIN_VALUE[domain]: {
                     "level": round(expertise, 2),
-                    "proficiency": self._get_proficiency_label(expertise)
+                    "proficiency": _PROFICIENCY_LABELS[bisect.bisect_right(_PROFICIENCY_THRESHOLDS, expertise)]
                 }
-                for domain, expertise in self.expertise_levels.items()
+                for domain, expertise in levels.items()
             },
-            "overall_expertise": round(sum(self.expertise_levels.values()) / len(self.expertise_levels), 2)
+            "overall_expertise": round(sum(levels.values()) / len(levels), 2)
         }
 
     def _get_proficiency_label(self, expertise: float) -> str:
         """Convert expertise score to proficiency label"""
 
-        if expertise >= 0.9:
-            return "Expert"
-        elif expertise >= 0.7:
-            return "Advanced"
-        elif expertise >= 0.5:
-            return "Intermediate"
-        elif expertise >= 0.3:
-            return "Developing"
-        else:
-            return "Beginner"
+        return _PROFICIENCY_LABELS[bisect.bisect_right(_PROFICIENCY_THRESHOLDS, expertise)]
 
-    def query_knowledge(self, query: str, domain: Optional[KnowledgeDomain] = None) -> List[KnowledgeItem]:
+    def query_knowledge(
+        self,
+        query: str,
+        domain: Optional[KnowledgeDomain] = None,
+        top_k: int = 20
+    ) -> List[KnowledgeItem]:
         """
         Query Sierra's knowledge base
 
+        Items match when their title, content, or tags contain every word
+        of the query (looked up in the token index, not scanned).
+
         Args:
             query: Search query
             domain: Optional domain filter
+            top_k: Maximum number of items to return
 
         Returns:
-            Relevant knowledge items
+            Relevant knowledge items, most relevant first
         """
 
-        results = []
-        query_lower = query.lower()
-
-        for item in self.knowledge_base.values():
-            # Filter by domain if specified
-            if domain and item.domain != domain:
-                continue
-
-            # Search in title, content, and tags
-            if (query_lower in item.title.lower() or
-                query_lower in item.content.lower() or
-                any(query_lower in tag.lower() for tag in item.tags)):
-                results.append(item)
-
-        # Sort by relevance
-        return sorted(results, key=lambda x: x.relevance_score, reverse=True)
+        self._ensure_loaded()
+        query_tokens = frozenset(_tokenize(query))
+
+        cache = self._query_cache
+        if self._query_cache_version != self._kb_version:
+            cache.clear()
+            self._query_cache_version = self._kb_version
+        key = (query_tokens, domain, top_k)
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return list(cached)
+
+        if domain:
+            candidates = set(self._domain_index.get(domain, ()))
+        else:
+            candidates = set(range(len(self._items)))
+
+        # Intersect postings, rarest token first so the set shrinks fastest
+        for token in sorted(query_tokens, key=lambda t: len(self._token_index.get(t, ()))):
+            candidates &= self._token_index.get(token, set())
+            if not candidates:
+                break
+
+        # Top-k by relevance (from the column); ties go to the earlier row,
+        # so results stay in insertion order without sorting every candidate
+        relevance = self._relevance
+        rows = heapq.nlargest(top_k, candidates, key=lambda row: (relevance[row], -row))
+        results = tuple(self._items[row] for row in rows)
+
+        cache[key] = results
+        if len(cache) > self.query_cache_size:
+            cache.popitem(last=False)
+        return list(results)
@@ -9,18 +9,32 @@ Voice Cortex Integration:
 """
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 import json
 import asyncio
-from datetime import datetime
+import gzip
+import hashlib
+import importlib.util
+import logging
+import logging.handlers
+import os
+import queue
+import socket
+import time
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 
 from .config import settings
 from .ai_engine import SafeHavenAI, ConversationMode
 from .safety_planning import SafetyPlanningAssistant
 from .resources import ResourceDatabase
+from ._serial import crisis_envelope, crisis_resources_frame, search_envelope
 
 # Voice Cortex integration
 try:
@@ -40,6 +54,13 @@ try:
 except ImportError:
     CORTEX_AVAILABLE = False
 
+# Audio danger monitoring (needs numpy; sounddevice for live capture)
+try:
+    from .audio_safety_system import get_audio_safety_system
+    AUDIO_AVAILABLE = True
+except ImportError:
+    AUDIO_AVAILABLE = False
+
 # Derek Protocol Client - Family network integration
 try:
     from .derek_protocol_client import (
@@ -52,20 +73,78 @@ try:
 except ImportError:
     DEREK_PROTOCOL_AVAILABLE = False
 
+# While the app runs, logging goes through a queue so handlers never block the
+# event loop on stderr; a QueueListener thread does the actual writes. The
+# queue handler is installed (and propagation turned off) only between the
+# startup and shutdown hooks, so imports, scripts and tests log normally.
+logger = logging.getLogger(__name__)
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_handler = logging.handlers.QueueHandler(_log_queue)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Binary WebSocket framing - msgpack payloads with a type-tag prefix
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+# Fast JSON encoding for API payloads and WebSocket messages
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Typed decoding of chat socket messages straight from JSON
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+# Shared session routing table for multi-worker deployments
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+# Brotli precompression for HTML responses (gzip is always available)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# uvloop event loop and httptools parser (shipped with uvicorn[standard];
+# uvloop is not available on Windows). Only detected here - the launcher asks
+# uvicorn for them, so importing this module never changes the loop policy.
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+HTTPTOOLS_AVAILABLE = importlib.util.find_spec("httptools") is not None
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.app_name,
     description="A trauma-informed AI companion for domestic violence survivors",
-    version="0.1.0"
+    version="0.1.0",
+    # Endpoints that return plain dicts are encoded with orjson when available
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
-# CORS middleware for security
+# CORS middleware for security: only the configured frontend origins, checked
+# by set membership. WebSocket scopes pass straight through (CORS is HTTP-only).
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
+    allow_origins=frozenset(settings.allowed_origins),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
 )
 
 # Mount static files for images/assets
@@ -73,7 +152,668 @@ app.mount("/static", StaticFiles(directory="src/static"), name="static")
 
 # Initialize core components
 resource_db = ResourceDatabase()
-active_sessions: Dict[str, Dict] = {}
+
+
+# Settings read once at import; they are fixed for the life of the process
+_ANTHROPIC_KEY = settings.anthropic_api_key
+_OPENAI_KEY = settings.openai_api_key
+_PROVIDER = "anthropic" if _ANTHROPIC_KEY else "openai"  # For new sessions
+_ACTIVE_PROVIDER = _PROVIDER if (_ANTHROPIC_KEY or _OPENAI_KEY) else "fallback"  # Reported by /health
+
+
+@lru_cache(maxsize=1)
+def shared_multimodal_processor() -> Optional[Any]:
+    """
+    One MultimodalProcessor for all sessions, built on first use.
+
+    Its calls hold no per-session state and run synchronously on the event
+    loop, so sessions can share it without locking.
+    """
+    return MultimodalProcessor() if VOICE_AVAILABLE else None
+
+
+SESSION_OUTBOX_SIZE = 256  # Queued outgoing messages before senders wait
+
+
+@dataclass(slots=True)
+class Session:
+    """
+    Per-connection chat state.
+
+    The AI engine and safety planner are built on first use, so accepting
+    a connection never waits on their constructors. Outgoing messages go
+    through the outbox, drained by the session's writer task.
+    """
+    websocket: WebSocket
+    voice_enabled: bool = False  # User can enable voice output
+    binary: bool = False  # Reply with msgpack frames (mirrors the client)
+    connected_at: str = ""
+    message_count: int = 0
+    outbox: "asyncio.Queue[Any]" = field(
+        default_factory=lambda: asyncio.Queue(maxsize=SESSION_OUTBOX_SIZE)
+    )
+    writer: Optional[asyncio.Task] = None
+    _ai_engine: Optional[SafeHavenAI] = None
+    _safety_planner: Optional[SafetyPlanningAssistant] = None
+
+    @property
+    def ai_engine(self) -> SafeHavenAI:
+        if self._ai_engine is None:
+            self._ai_engine = SafeHavenAI(provider=_PROVIDER)
+        return self._ai_engine
+
+    @property
+    def safety_planner(self) -> SafetyPlanningAssistant:
+        if self._safety_planner is None:
+            self._safety_planner = SafetyPlanningAssistant()
+        return self._safety_planner
+
+    @property
+    def multimodal_processor(self) -> Optional[Any]:
+        return shared_multimodal_processor()
+
+    def clear_history(self):
+        """Clear conversation history (nothing to clear if the engine was never built)"""
+        if self._ai_engine is not None:
+            self._ai_engine.clear_history()
+
+    async def send(self, message: Any):
+        """
+        Queue a message (dict or EncodedMessage); waits if the client is falling behind.
+
+        Raises WebSocketDisconnect once the writer has stopped, since nothing
+        would ever send (or drain) the message.
+        """
+        if self.writer is not None and self.writer.done():
+            raise WebSocketDisconnect(1006)
+        await self.outbox.put(message)
+
+
+async def _session_writer(session: Session):
+    """
+    Drain a session's outbox onto its WebSocket.
+
+    Waits for one message, then takes everything else already queued, so a
+    burst goes out as a single batch frame instead of one frame per message.
+    """
+    outbox = session.outbox
+    try:
+        while True:
+            messages = [await outbox.get()]
+            while True:
+                try:
+                    messages.append(outbox.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            await send_batch(session.websocket, messages, session.binary)
+    except (WebSocketDisconnect, RuntimeError, OSError):
+        # Socket closed (OSError covers the server's ClientDisconnected)
+        pass
+    except Exception:
+        logger.exception("Session writer failed")
+    finally:
+        # Nothing sends on this socket any more. Empty the outbox so a send()
+        # blocked on a full queue wakes up (its next call raises), and close
+        # the socket so the receive loop sees the disconnect and cleans up.
+        while not outbox.empty():
+            outbox.get_nowait()
+        try:
+            await session.websocket.close()
+        except Exception:
+            pass
+
+
+# Active sessions, sharded by session id so connects and disconnects on
+# different shards never wait on the same lock
+SESSION_SHARD_COUNT = 16  # Must be a power of two
+_session_shards: List[Dict[str, Session]] = [{} for _ in range(SESSION_SHARD_COUNT)]
+_session_locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(SESSION_SHARD_COUNT)]
+
+
+def _shard_index(session_id: str) -> int:
+    """Shard holding a session id"""
+    return hash(session_id) & (SESSION_SHARD_COUNT - 1)
+
+
+def get_session(session_id: str) -> Optional[Session]:
+    """Look up an active session"""
+    return _session_shards[_shard_index(session_id)].get(session_id)
+
+
+async def add_session(session_id: str, session: Session):
+    """Register a session in its shard"""
+    index = _shard_index(session_id)
+    async with _session_locks[index]:
+        _session_shards[index][session_id] = session
+
+
+async def remove_session(session_id: str) -> Optional[Session]:
+    """Drop a session from its shard, returning it if it existed"""
+    index = _shard_index(session_id)
+    async with _session_locks[index]:
+        return _session_shards[index].pop(session_id, None)
+
+
+def active_session_count() -> int:
+    """Number of connected chat sessions across all shards"""
+    return sum(len(shard) for shard in _session_shards)
+
+
+# Session routing. A session's AI engine and safety planner stay in the shards
+# of the worker holding its WebSocket; with settings.redis_url set, workers also
+# record which of them owns each session_id, so a proxy that is sticky on the
+# /ws/{session_id} path can be checked and other workers can locate a session.
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+SESSION_ROUTE_PREFIX = "sierra:session:"
+SESSION_ROUTE_TTL = settings.session_expire_minutes * 60
+
+_session_router: Optional[Any] = None
+
+
+def get_session_router() -> Optional[Any]:
+    """Redis client for the routing table, or None when not configured"""
+    global _session_router
+    if _session_router is None and REDIS_AVAILABLE and settings.redis_url:
+        _session_router = aioredis.from_url(settings.redis_url, decode_responses=True)
+    return _session_router
+
+
+async def claim_session_route(session_id: str) -> Optional[str]:
+    """
+    Record this worker as the owner of a session.
+
+    Returns the previous owner when it was a different worker, meaning the
+    session's history was left behind there. Routing is best-effort: Redis
+    errors are logged and never fail the connection.
+    """
+    router = get_session_router()
+    if router is None:
+        return None
+    try:
+        previous = await router.set(
+            SESSION_ROUTE_PREFIX + session_id, WORKER_ID, ex=SESSION_ROUTE_TTL, get=True
+        )
+    except Exception:
+        logger.warning("Could not record route for session %s", session_id, exc_info=True)
+        return None
+    return previous if previous not in (None, WORKER_ID) else None
+
+
+async def release_session_route(session_id: str):
+    """Drop a session's route if this worker still owns it"""
+    router = get_session_router()
+    if router is None:
+        return
+    key = SESSION_ROUTE_PREFIX + session_id
+    try:
+        if await router.get(key) == WORKER_ID:
+            await router.delete(key)
+    except Exception:
+        logger.warning("Could not release route for session %s", session_id, exc_info=True)
+
+
+async def session_worker(session_id: str) -> Optional[str]:
+    """Worker currently holding a session, if routing is configured and it is known"""
+    router = get_session_router()
+    if router is None:
+        return None
+    return await router.get(SESSION_ROUTE_PREFIX + session_id)
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Fallback encoder for types the serializers don't handle natively.
+
+    Lets handlers pass datetimes and Pydantic models straight into a
+    payload instead of calling isoformat()/model_dump() themselves.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    model_dump = getattr(obj, "model_dump", None)
+    if model_dump is not None:
+        return model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_encode_default)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_encode_default
+    ).encode("utf-8")
+
+
+def loads_json(data: Any) -> Any:
+    """Parse JSON text or bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _frame_tag(message_type: str) -> bytes:
+    """Frame prefix: [1 byte: tag length][type tag]"""
+    tag = message_type.encode("utf-8")[:255]
+    return bytes((len(tag),)) + tag
+
+
+def _pack_frame(message: Dict[str, Any]) -> bytes:
+    """
+    Encode a message as a binary frame: [1 byte: tag length][type tag][msgpack body].
+
+    The tag lets the client route assistant/resources/crisis frames
+    without decoding the body.
+    """
+    return _frame_tag(str(message.get("type", ""))) + msgpack.packb(
+        message, use_bin_type=True, default=_encode_default
+    )
+
+
+def _unpack_frame(frame: bytes) -> Dict[str, Any]:
+    """Decode a binary frame produced by _pack_frame (or the client equivalent)"""
+    body = memoryview(frame)[1 + frame[0]:]
+    return msgpack.unpackb(body, raw=False)
+
+
+async def _receive_frame(websocket: WebSocket) -> Tuple[Any, bool]:
+    """
+    Receive one client frame.
+
+    Returns the payload and whether the client used msgpack framing: an
+    unpacked dict for msgpack frames, otherwise the raw JSON text or bytes.
+    Clients without a msgpack codec send JSON, either as text or as UTF-8
+    bytes in a binary frame (parsed straight from bytes, skipping text
+    validation).
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+
+    frame = message.get("bytes")
+    if frame is not None:
+        if frame[:1] == b"{":
+            # JSON object; a msgpack frame would need a 123-byte type tag here
+            return frame, False
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("Binary frames require msgpack: pip install msgpack")
+        return _unpack_frame(frame), True
+    return message["text"], False
+
+
+async def receive_message(websocket: WebSocket) -> Tuple[Dict[str, Any], bool]:
+    """
+    Receive one client message.
+
+    Returns the decoded message and whether replies should use msgpack
+    framing, mirroring the framing the client chose.
+    """
+    payload, binary = await _receive_frame(websocket)
+    return (payload if binary else loads_json(payload)), binary
+
+
+@dataclass(slots=True)
+class ClientMessage:
+    """A chat socket message; fields the client leaves out take these defaults"""
+    type: str = "chat"
+    message: str = ""
+    stream: bool = False
+    need: str = "crisis"
+    action: str = "view"
+
+
+_CLIENT_MESSAGE_FIELDS = frozenset(f.name for f in fields(ClientMessage))
+
+if MSGSPEC_AVAILABLE:
+    # Validates and fills the dataclass in one pass, ignoring unknown keys
+    _client_message_decoder = msgspec.json.Decoder(ClientMessage)
+
+
+def to_client_message(data: Dict[str, Any]) -> ClientMessage:
+    """Build a ClientMessage from an already-decoded dict"""
+    return ClientMessage(**{k: v for k, v in data.items() if k in _CLIENT_MESSAGE_FIELDS})
+
+
+async def receive_client_message(websocket: WebSocket) -> Tuple[ClientMessage, bool]:
+    """Receive one chat socket message, typed; see _receive_frame for framing"""
+    payload, binary = await _receive_frame(websocket)
+    if binary:
+        return to_client_message(payload), True
+    if MSGSPEC_AVAILABLE:
+        return _client_message_decoder.decode(payload), False
+    return to_client_message(loads_json(payload)), False
+
+
+async def send_message(websocket: WebSocket, message: Dict[str, Any], binary: bool = False):
+    """Send a message using binary msgpack framing or JSON text"""
+    if binary:
+        await websocket.send_bytes(_pack_frame(message))
+    else:
+        await websocket.send_text(dumps_json(message).decode("utf-8"))
+
+
+def _report_send_error(future):
+    """Log failures from sends scheduled off the event loop thread"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("WebSocket send error", exc_info=future.exception())
+
+
+def send_threadsafe(loop: asyncio.AbstractEventLoop, coro):
+    """
+    Schedule a send coroutine from a worker thread (cortex or audio callbacks).
+
+    asyncio.create_task only works on the loop's own thread; this hands the
+    coroutine to the loop and logs the outcome instead of losing it.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    future.add_done_callback(_report_send_error)
+    return future
+
+
+class EncodedMessage(NamedTuple):
+    """A message pre-encoded for both WebSocket framings"""
+    text: str
+    frame: Optional[bytes]
+
+
+def encode_message(message: Dict[str, Any]) -> EncodedMessage:
+    """Encode a static message once so sends skip serialization"""
+    return EncodedMessage(
+        text=dumps_json(message).decode("utf-8"),
+        frame=_pack_frame(message) if MSGPACK_AVAILABLE else None
+    )
+
+
+async def send_encoded(websocket: WebSocket, encoded: EncodedMessage, binary: bool = False):
+    """Send a pre-encoded message in the requested framing"""
+    if binary:
+        await websocket.send_bytes(encoded.frame)
+    else:
+        await websocket.send_text(encoded.text)
+
+
+def _batch_frame(messages: List[Any]) -> bytes:
+    """Binary batch frame, splicing in the msgpack bodies of pre-encoded messages"""
+    packer = msgpack.Packer(use_bin_type=True, default=_encode_default)
+    bodies = []
+    for message in messages:
+        if isinstance(message, EncodedMessage):
+            bodies.append(memoryview(message.frame)[1 + message.frame[0]:])
+        else:
+            bodies.append(packer.pack(message))
+    header = (
+        packer.pack_map_header(2) + packer.pack("type") + packer.pack("batch")
+        + packer.pack("batch") + packer.pack_array_header(len(bodies))
+    )
+    return _frame_tag("batch") + header + b"".join(bodies)
+
+
+def _batch_text(messages: List[Any]) -> str:
+    """JSON batch envelope, splicing in the text of pre-encoded messages"""
+    parts = [
+        message.text if isinstance(message, EncodedMessage) else dumps_json(message).decode("utf-8")
+        for message in messages
+    ]
+    return '{"type":"batch","batch":[' + ",".join(parts) + "]}"
+
+
+async def send_batch(websocket: WebSocket, messages: List[Any], binary: bool = False):
+    """
+    Send the messages of one turn (dicts or EncodedMessages) as a single frame.
+
+    Several messages go out as {"type": "batch", "batch": [...]}, one WebSocket
+    frame and one write; a single message is sent unwrapped.
+    """
+    if len(messages) == 1:
+        message = messages[0]
+        if isinstance(message, EncodedMessage):
+            await send_encoded(websocket, message, binary)
+        else:
+            await send_message(websocket, message, binary)
+    elif binary:
+        await websocket.send_bytes(_batch_frame(messages))
+    else:
+        await websocket.send_text(_batch_text(messages))
+
+
+# Precompressed responses - bodies are compressed once and picked per request
+MIN_COMPRESS_SIZE = 512  # Bytes; smaller bodies are sent as-is
+
+# (gzip level, brotli quality). Static bodies are compressed once at startup,
+# so they get the smallest output; per-query bodies are compressed on the
+# request path the first time a client sends a new query, so they use cheap
+# levels that can't be abused to burn CPU on the event loop.
+STATIC_COMPRESSION = (9, 11)
+DYNAMIC_COMPRESSION = (6, 5)
+
+
+def compress_variants(
+    content: bytes,
+    compress: bool = True,
+    levels: Tuple[int, int] = STATIC_COMPRESSION
+) -> Dict[str, bytes]:
+    """Build the identity, gzip and (if installed) brotli encodings of a body"""
+    variants = {"identity": content}
+    if compress and len(content) >= MIN_COMPRESS_SIZE:
+        gzip_level, brotli_quality = levels
+        variants["gzip"] = gzip.compress(content, compresslevel=gzip_level, mtime=0)
+        if BROTLI_AVAILABLE:
+            variants["br"] = brotli.compress(content, quality=brotli_quality)
+    return variants
+
+
+def pick_encoding(accept_encoding: str, variants: Dict[str, bytes]) -> str:
+    """Choose the best available variant for an Accept-Encoding header"""
+    accepted = set()
+    for token in accept_encoding.split(","):
+        coding, _, params = token.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=0") and params.strip("q=0.") == "":
+            continue  # q=0 means "not acceptable"
+        accepted.add(coding.strip().lower())
+
+    for encoding in ("br", "gzip"):
+        if encoding in variants and (encoding in accepted or "*" in accepted):
+            return encoding
+    return "identity"
+
+
+def encoded_response(
+    request: Request,
+    variants: Dict[str, bytes],
+    etag: str,
+    media_type: str,
+    cache_control: Optional[str] = None
+) -> Response:
+    """
+    Serve the best precompressed variant, answering 304 when the client's
+    ETag matches. Each encoding gets its own ETag since the bytes differ.
+    """
+    encoding = pick_encoding(request.headers.get("accept-encoding", ""), variants)
+    headers = {"Vary": "Accept-Encoding"}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+        etag = f'{etag[:-1]}-{encoding}"'
+    headers["ETag"] = etag
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(variants[encoding], media_type=media_type, headers=headers)
+
+
+def make_etag(content: bytes) -> str:
+    """Strong ETag for a response body"""
+    return '"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+
+
+# Message timestamps - formatted at most once per wall-clock second. Clients
+# only display them to the second, so sub-second precision is dropped.
+_timestamp_cache: List[Any] = [0, ""]  # [epoch second, ISO string]
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO string, to the second"""
+    second = int(time.time())
+    cache = _timestamp_cache
+    if cache[0] != second:
+        cache[1] = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        cache[0] = second
+    return cache[1]
+
+
+# Crisis messages - crisis resources are static, so the frames are encoded once
+CRISIS_VOICE_TEXT = "I'm concerned about your safety. Emergency resources are available 24/7."
+CRISIS_CAPTURE_VOICE_TEXT = (
+    "I'm very concerned about your safety. "
+    "If you're in immediate danger, call 911. "
+    "The National Domestic Violence Hotline is 1-800-799-7233."
+)
+
+
+@lru_cache(maxsize=1)
+def crisis_resources_message() -> EncodedMessage:
+    """Resources frame sent to chat sessions when a crisis is detected"""
+    message = crisis_resources_frame(resource_db.get_crisis_resources(), "resources")
+    message["priority"] = "high"
+    return encode_message(message)
+
+
+@lru_cache(maxsize=1)
+def crisis_capture_message() -> EncodedMessage:
+    """Resources frame sent by the behavior capture socket on a crisis trigger"""
+    return encode_message(
+        crisis_resources_frame(resource_db.get_crisis_resources(), "crisis_resources")
+    )
+
+
+# Template registry - HTML pages are read once and served from memory
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+TEMPLATES: Dict[str, Dict[str, bytes]] = {}
+TEMPLATE_ETAGS: Dict[str, str] = {}
+# Dev mode: re-read templates from disk on every request
+TEMPLATE_RELOAD = os.getenv("SIERRA_TEMPLATE_RELOAD", "").lower() in ("1", "true", "yes")
+
+
+def _store_template(name: str, content: bytes):
+    """Cache a template's encodings and its ETag"""
+    # Skip compression in reload mode, where templates are re-read per request
+    TEMPLATES[name] = compress_variants(content, compress=not TEMPLATE_RELOAD)
+    TEMPLATE_ETAGS[name] = make_etag(content)
+
+
+def load_templates():
+    """Read every template in TEMPLATES_DIR into the registry"""
+    for path in TEMPLATES_DIR.glob("*.html"):
+        _store_template(path.name, path.read_bytes())
+
+
+def template_response(
+    request: Request,
+    name: str,
+    cache_control: Optional[str] = None
+) -> Response:
+    """
+    Serve a cached template in the best encoding the client accepts.
+
+    Falls back to reading from disk when the template is not cached yet
+    (or always, in reload mode). Raises FileNotFoundError if it does not exist.
+    """
+    if TEMPLATE_RELOAD or name not in TEMPLATES:
+        _store_template(name, (TEMPLATES_DIR / name).read_bytes())
+    return encoded_response(
+        request, TEMPLATES[name], TEMPLATE_ETAGS[name], "text/html", cache_control=cache_control
+    )
+
+
+# Resource payloads - resource_db is static, so each response body is encoded once
+# and clients/CDNs may reuse it for an hour (revalidating by ETag after that)
+RESOURCE_CACHE_CONTROL = "public, max-age=3600"
+
+
+@lru_cache(maxsize=1)
+def crisis_resources_payload() -> Tuple[Dict[str, bytes], str]:
+    """Encoded body variants and ETag for /api/resources/crisis"""
+    body = dumps_json(crisis_envelope(
+        resource_db.get_crisis_resources(),
+        resource_db.get_emergency_card()
+    ))
+    return compress_variants(body), make_etag(body)
+
+
+# Result sets larger than this are encoded on the default executor so one
+# broad search doesn't stall every other connected session
+LARGE_PAYLOAD_ITEMS = 50
+
+
+@lru_cache(maxsize=512)
+def search_results(query: str) -> Tuple[Any, ...]:
+    """Resources matching a search query, memoized per query"""
+    return tuple(resource_db.search(query))
+
+
+@lru_cache(maxsize=512)
+def search_resources_payload(query: str) -> Tuple[Dict[str, bytes], str]:
+    """Encoded body variants and ETag for /api/resources/search, memoized per query"""
+    body = dumps_json(search_envelope(query, list(search_results(query))))
+    return compress_variants(body, levels=DYNAMIC_COMPRESSION), make_etag(body)
+
+
+@lru_cache(maxsize=128)
+def resources_by_need_text(need: str) -> str:
+    """Formatted resource listing for a (lowercased) need, memoized per need"""
+    return resource_db.get_resources_by_need(need)
+
+
+@lru_cache(maxsize=128)
+def resources_by_need_payload(need: str) -> Tuple[Dict[str, bytes], str]:
+    """Encoded body variants and ETag for /api/resources/by-need/{need}, memoized per need"""
+    body = dumps_json({
+        "need": need,
+        "resources": resources_by_need_text(need.lower())
+    })
+    return compress_variants(body, levels=DYNAMIC_COMPRESSION), make_etag(body)
+
+
+@app.on_event("startup")
+async def preload_static_content():
+    """Load HTML templates and static API payloads before serving requests"""
+    load_templates()
+    crisis_resources_payload()
+    crisis_resources_message()
+    crisis_capture_message()
+
+
+@app.on_event("startup")
+async def start_logging():
+    """Start the background thread that writes queued log records and route records to it"""
+    global _log_listener
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+    logger.addHandler(_log_handler)
+    logger.propagate = False
+
+
+@app.on_event("shutdown")
+async def close_session_router():
+    """Close the routing table connection pool"""
+    global _session_router
+    if _session_router is not None:
+        await _session_router.aclose()
+        _session_router = None
+
+
+@app.on_event("shutdown")
+async def stop_logging():
+    """Restore direct logging, then flush queued log records and stop the writer thread"""
+    global _log_listener
+    logger.removeHandler(_log_handler)
+    logger.propagate = True
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 @app.on_event("startup")
@@ -99,7 +839,6 @@ async def startup_event():
 
             # Bootstrap Sierra to family network
             # Derek URL can be configured via environment variable
-            import os
             derek_url = os.getenv("DEREK_URL", "ws://localhost:8001/derek")
 
             derek_client = bootstrap_sierra_to_family(
@@ -137,173 +876,209 @@ async def shutdown_event():
             print(f"Derek Protocol shutdown error: {e}")
 
 
+BROADCAST_GROUP_SIZE = 50
+
+
 class ConnectionManager:
     """Manage WebSocket connections"""
 
-    def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-
-    async def connect(self, websocket: WebSocket, session_id: str):
+    async def connect(self, websocket: WebSocket, session_id: str) -> Session:
         """Connect a new WebSocket"""
         await websocket.accept()
-        self.active_connections[session_id] = websocket
 
         # Initialize session
-        active_sessions[session_id] = {
-            "ai_engine": SafeHavenAI(provider="anthropic" if settings.anthropic_api_key else "openai"),
-            "safety_planner": SafetyPlanningAssistant(),
-            "multimodal_processor": MultimodalProcessor() if VOICE_AVAILABLE else None,
-            "voice_enabled": False,  # User can enable voice output
-            "connected_at": datetime.now().isoformat(),
-            "message_count": 0
-        }
+        session = Session(websocket=websocket, connected_at=now_iso())
+        session.writer = asyncio.create_task(_session_writer(session))
+        await add_session(session_id, session)
+
+        previous_worker = await claim_session_route(session_id)
+        if previous_worker is not None:
+            logger.warning(
+                "Session %s reconnected on %s but was held by %s; is the proxy sticky on /ws/{session_id}?",
+                session_id, WORKER_ID, previous_worker
+            )
+        return session
 
-    def disconnect(self, session_id: str):
+    async def disconnect(self, session_id: str):
         """Disconnect a WebSocket"""
-        if session_id in self.active_connections:
-            del self.active_connections[session_id]
-        if session_id in active_sessions:
-            # Clean up session data for privacy
-            del active_sessions[session_id]
+        # Clean up session data for privacy
+        session = await remove_session(session_id)
+        if session is not None and session.writer is not None:
+            session.writer.cancel()
+        await release_session_route(session_id)
 
     async def send_message(self, session_id: str, message: dict):
         """Send a message to a specific session"""
-        if session_id in self.active_connections:
-            await self.active_connections[session_id].send_json(message)
+        session = get_session(session_id)
+        if session is not None:
+            await session.send(message)
+
+    async def broadcast(self, message: dict, session_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Send one message to many sessions (all of them by default).
+
+        The message is encoded once and shared by every recipient. Sends
+        are queued concurrently in groups of BROADCAST_GROUP_SIZE, yielding
+        to the event loop between groups so a large broadcast doesn't starve
+        other connections. Returns the number of sessions addressed.
+        """
+        encoded = encode_message(message)
+        if session_ids is None:
+            sessions = [session for shard in _session_shards for session in shard.values()]
+        else:
+            sessions = [session for session in map(get_session, session_ids) if session is not None]
+
+        for start in range(0, len(sessions), BROADCAST_GROUP_SIZE):
+            group = sessions[start:start + BROADCAST_GROUP_SIZE]
+            await asyncio.gather(*(session.send(encoded) for session in group), return_exceptions=True)
+            await asyncio.sleep(0)
+        return len(sessions)
 
 
 manager = ConnectionManager()
 
 
+# The landing page is the most-hit route; let browsers reuse it for a few
+# minutes before revalidating by ETag
+HOME_CACHE_CONTROL = "no-cache" if TEMPLATE_RELOAD else "public, max-age=300"
+
+
 @app.get("/", response_class=HTMLResponse)
-async def get_home():
+async def get_home(request: Request):
     """Serve the main Sierra hub - her personality landing page"""
     try:
-        with open("/home/user/Siera/src/templates/index.html", "r") as f:
-            return f.read()
+        return template_response(request, "index.html", cache_control=HOME_CACHE_CONTROL)
     except FileNotFoundError:
         # Fallback to old interface if new one doesn't exist
-        return get_html_interface()
+        variants, etag = html_interface_variants()
+        return encoded_response(
+            request, variants, etag, "text/html", cache_control=HOME_CACHE_CONTROL
+        )
 
 
 @app.get("/behavior_capture", response_class=HTMLResponse)
-async def get_behavior_capture():
+async def get_behavior_capture(request: Request):
     """Serve the behavior capture interface"""
-    with open("/home/user/Siera/src/templates/behavior_capture.html", "r") as f:
-        return f.read()
+    return template_response(request, "behavior_capture.html")
 
 
 @app.get("/chat", response_class=HTMLResponse)
-async def get_chat():
+async def get_chat(request: Request):
     """Serve the enhanced chat interface with speech-to-speech"""
     try:
-        with open("src/templates/chat_enhanced.html", "r") as f:
-            return f.read()
+        return template_response(request, "chat_enhanced.html")
     except FileNotFoundError:
         # Fallback to original chat
-        with open("src/templates/chat.html", "r") as f:
-            return f.read()
+        return template_response(request, "chat.html")
 
 
 @app.get("/private-corner", response_class=HTMLResponse)
-async def get_private_corner():
+async def get_private_corner(request: Request):
     """Serve the private corner - encrypted safe space"""
-    with open("/home/user/Siera/src/templates/private_corner.html", "r") as f:
-        return f.read()
+    return template_response(request, "private_corner.html")
 
 
 @app.get("/kids-mode", response_class=HTMLResponse)
-async def get_kids_mode():
+async def get_kids_mode(request: Request):
     """Serve the kids emergency mode"""
-    with open("/home/user/Siera/src/templates/kids_mode.html", "r") as f:
-        return f.read()
+    return template_response(request, "kids_mode.html")
 
 
 @app.get("/about", response_class=HTMLResponse)
-async def get_about():
+async def get_about(request: Request):
     """Serve the About Sierra page - who she is, her personality"""
-    with open("/home/user/Siera/src/templates/about.html", "r") as f:
-        return f.read()
+    return template_response(request, "about.html")
+
+
+# Safety plan redirect page (static)
+_SAFETY_PLAN_HTML: bytes = b"""<!DOCTYPE html>
+<html>
+<head>
+    <meta http-equiv="refresh" content="0; url=/chat">
+    <script>
+        setTimeout(function() {
+            window.location.href = '/chat';
+            // Auto-send safety planning message
+            setTimeout(function() {
+                const input = document.getElementById('messageInput');
+                if (input) {
+                    input.value = 'I want to create a safety plan';
+                    document.querySelector('.send-button').click();
+                }
+            }, 1000);
+        }, 100);
+    </script>
+</head>
+<body>
+    <p>Redirecting to chat for safety planning...</p>
+</body>
+</html>
+"""
+_SAFETY_PLAN_VARIANTS = compress_variants(_SAFETY_PLAN_HTML)
+_SAFETY_PLAN_ETAG = make_etag(_SAFETY_PLAN_HTML)
 
 
 @app.get("/safety-plan", response_class=HTMLResponse)
-async def get_safety_plan():
+async def get_safety_plan(request: Request):
     """Serve the interactive safety planning page"""
     # For now, redirect to chat with safety planning prompt
     # Can create dedicated page later
-    return """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta http-equiv="refresh" content="0; url=/chat">
-        <script>
-            setTimeout(function() {
-                window.location.href = '/chat';
-                // Auto-send safety planning message
-                setTimeout(function() {
-                    const input = document.getElementById('messageInput');
-                    if (input) {
-                        input.value = 'I want to create a safety plan';
-                        document.querySelector('.send-button').click();
-                    }
-                }, 1000);
-            }, 100);
-        </script>
-    </head>
-    <body>
-        <p>Redirecting to chat for safety planning...</p>
-    </body>
-    </html>
-    """
+    return encoded_response(request, _SAFETY_PLAN_VARIANTS, _SAFETY_PLAN_ETAG, "text/html")
 
 
 @app.get("/resources", response_class=HTMLResponse)
-async def get_resources():
+async def get_resources(request: Request):
     """Serve the resources page"""
-    with open("/home/user/Siera/src/templates/resources.html", "r") as f:
-        return f.read()
+    return template_response(request, "resources.html")
+
+
+# Health check body (static)
+_HEALTH_JSON = dumps_json({
+    "status": "healthy",
+    "app_name": settings.app_name,
+    "version": "0.1.0",
+    "ai_provider": _ACTIVE_PROVIDER
+})
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "app_name": settings.app_name,
-        "version": "0.1.0",
-        "ai_provider": "anthropic" if settings.anthropic_api_key else "openai" if settings.openai_api_key else "fallback"
-    }
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 
 @app.get("/api/resources/crisis")
-async def get_crisis_resources():
+async def get_crisis_resources(request: Request):
     """Get crisis resources"""
-    resources = resource_db.get_crisis_resources()
-    return {
-        "resources": [r.model_dump() for r in resources],
-        "emergency_card": resource_db.get_emergency_card()
-    }
+    variants, etag = crisis_resources_payload()
+    return encoded_response(
+        request, variants, etag, "application/json", cache_control=RESOURCE_CACHE_CONTROL
+    )
 
 
 @app.get("/api/resources/search")
-async def search_resources(query: str):
+async def search_resources(request: Request, query: str):
     """Search resources"""
-    results = resource_db.search(query)
-    return {
-        "query": query,
-        "results": [r.model_dump() for r in results],
-        "count": len(results)
-    }
+    # Matching is case-insensitive, so normalize before hitting the caches
+    query = query.strip().lower()
+    if len(search_results(query)) > LARGE_PAYLOAD_ITEMS:
+        variants, etag = await asyncio.get_running_loop().run_in_executor(
+            None, search_resources_payload, query
+        )
+    else:
+        variants, etag = search_resources_payload(query)
+    return encoded_response(
+        request, variants, etag, "application/json", cache_control=RESOURCE_CACHE_CONTROL
+    )
 
 
 @app.get("/api/resources/by-need/{need}")
-async def get_resources_by_need(need: str):
+async def get_resources_by_need(request: Request, need: str):
     """Get resources by specific need"""
-    formatted = resource_db.get_resources_by_need(need)
-    return {
-        "need": need,
-        "resources": formatted
-    }
+    variants, etag = resources_by_need_payload(need)
+    return encoded_response(
+        request, variants, etag, "application/json", cache_control=RESOURCE_CACHE_CONTROL
+    )
 
 
 @app.post("/api/quick-exit")
@@ -316,42 +1091,141 @@ async def quick_exit():
     }
 
 
+async def _handle_get_resources(session: Session, message: ClientMessage):
+    """Get resources by need"""
+    resources_text = resources_by_need_text(message.need.lower())
+
+    await session.send({
+        "type": "resources",
+        "message": resources_text,
+        "timestamp": now_iso()
+    })
+
+
+async def _handle_safety_plan(session: Session, message: ClientMessage):
+    """Handle safety planning"""
+    action = message.action
+    safety_planner = session.safety_planner
+
+    if action == "create":
+        plan = safety_planner.create_new_plan()
+        await session.send({
+            "type": "safety_plan",
+            "action": "created",
+            "plan": plan,
+            "timestamp": now_iso()
+        })
+
+    elif action == "export":
+        plan_text = safety_planner.export_to_text()
+        await session.send({
+            "type": "safety_plan",
+            "action": "export",
+            "plan_text": plan_text,
+            "timestamp": now_iso()
+        })
+
+    elif action == "summary":
+        summary = safety_planner.get_plan_summary()
+        await session.send({
+            "type": "safety_plan",
+            "action": "summary",
+            "summary": summary,
+            "timestamp": now_iso()
+        })
+
+
+async def _handle_clear_history(session: Session, message: ClientMessage):
+    """Clear conversation history for privacy"""
+    session.clear_history()
+    await session.send({
+        "type": "system",
+        "message": "Conversation history cleared for your privacy.",
+        "timestamp": now_iso()
+    })
+
+
+async def _handle_toggle_voice(session: Session, message: ClientMessage):
+    """Toggle voice output"""
+    if VOICE_AVAILABLE:
+        session.voice_enabled = not session.voice_enabled
+        new_status = "enabled" if session.voice_enabled else "disabled"
+
+        await session.send({
+            "type": "system",
+            "message": f"Voice output {new_status}.",
+            "voice_enabled": session.voice_enabled,
+            "timestamp": now_iso()
+        })
+
+        # Speak confirmation if voice just enabled
+        if session.voice_enabled:
+            voice_cortex = get_voice_cortex()
+            voice_cortex.speak("Voice output is now enabled. I can speak my responses to you.")
+    else:
+        await session.send({
+            "type": "system",
+            "message": "Voice output is not available on this system.",
+            "voice_available": False,
+            "timestamp": now_iso()
+        })
+
+
+# Welcome message, pre-encoded around its timestamp
+_WELCOME_PREFIX, _WELCOME_SUFFIX = dumps_json({
+    "type": "system",
+    "message": "Connected to SafeHaven AI. You're safe here. How can I support you today?",
+    "timestamp": "\x00"
+}).decode("utf-8").split("\\u0000")
+
+
+# Chat socket handlers for every message type except "chat"
+CHAT_HANDLERS: Dict[str, Callable[[Session, ClientMessage], Awaitable[None]]] = {
+    "get_resources": _handle_get_resources,
+    "safety_plan": _handle_safety_plan,
+    "clear_history": _handle_clear_history,
+    "toggle_voice": _handle_toggle_voice,
+}
+
+
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for real-time chat"""
-    await manager.connect(websocket, session_id)
+    session = await manager.connect(websocket, session_id)
 
     try:
         # Send welcome message
-        await manager.send_message(session_id, {
-            "type": "system",
-            "message": "Connected to SafeHaven AI. You're safe here. How can I support you today?",
-            "timestamp": datetime.now().isoformat()
-        })
+        # Sent directly (ahead of the outbox) since nothing else is queued yet
+        # and the client hasn't picked a framing: JSON text from a template
+        await websocket.send_text(_WELCOME_PREFIX + now_iso() + _WELCOME_SUFFIX)
 
         while True:
             # Receive message from user
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
-
-            # Get session components
-            session = active_sessions[session_id]
-            ai_engine = session["ai_engine"]
-            safety_planner = session["safety_planner"]
-            session["message_count"] += 1
+            client_message, session.binary = await receive_client_message(websocket)
+            session.message_count += 1
 
-            user_message = message_data.get("message", "")
-            message_type = message_data.get("type", "chat")
+            user_message = client_message.message
+            message_type = client_message.type
 
-            # Handle different message types
+            # Chat is the hot path; other message types go through CHAT_HANDLERS
             if message_type == "chat":
-                # Get AI response
-                response = await ai_engine.get_response(user_message)
+                # Get AI response; clients that opt in with "stream" see the
+                # text as it is generated and then a closing assistant_done
+                if client_message.stream:
+                    reply_type = "assistant_done"
+                    async for chunk in session.ai_engine.get_response_stream(user_message):
+                        if isinstance(chunk, str):
+                            await session.send({"type": "assistant_delta", "delta": chunk})
+                        else:
+                            response = chunk
+                else:
+                    reply_type = "assistant"
+                    response = await session.ai_engine.get_response(user_message)
 
                 # Voice output if enabled and available
-                voice_enabled = session.get("voice_enabled", False)
-                if voice_enabled and session.get("multimodal_processor"):
-                    multimodal = session["multimodal_processor"]
+                voice_enabled = session.voice_enabled
+                if voice_enabled and session.multimodal_processor:
+                    multimodal = session.multimodal_processor
 
                     # Generate voice response with appropriate emotion
                     voice_response = multimodal.generate_accessible_response(
@@ -361,122 +1235,44 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                         needs_grounding=(response["mode"] == "EMOTIONAL_SUPPORT")
                     )
 
-                # Send response back
-                await manager.send_message(session_id, {
-                    "type": "assistant",
+                # Assistant reply, plus emergency resources if crisis detected;
+                # the session writer sends them together in one frame
+                await session.send({
+                    "type": reply_type,
                     "message": response["response"],
                     "mode": response["mode"],
                     "is_crisis": response["is_crisis"],
                     "emergency_resources": response.get("emergency_resources"),
                     "safety_reminder": response.get("safety_reminder"),
                     "voice_enabled": voice_enabled,
+                    "truncated": response.get("truncated", False),
                     "timestamp": response["timestamp"]
                 })
-
-                # If crisis detected, also send emergency resources
                 if response["is_crisis"]:
-                    crisis_resources = resource_db.get_crisis_resources()
-                    await manager.send_message(session_id, {
-                        "type": "resources",
-                        "resources": [r.model_dump() for r in crisis_resources],
-                        "priority": "high"
-                    })
-
-                    # Crisis voice output (always speak crisis messages if voice available)
-                    if VOICE_AVAILABLE and session.get("multimodal_processor"):
-                        voice_cortex = get_voice_cortex()
-                        voice_cortex.speak_crisis(
-                            "I'm concerned about your safety. Emergency resources are available 24/7."
-                        )
-
-            elif message_type == "get_resources":
-                # Get resources by need
-                need = message_data.get("need", "crisis")
-                resources_text = resource_db.get_resources_by_need(need)
-
-                await manager.send_message(session_id, {
-                    "type": "resources",
-                    "message": resources_text,
-                    "timestamp": datetime.now().isoformat()
-                })
+                    await session.send(crisis_resources_message())
 
-            elif message_type == "safety_plan":
-                # Handle safety planning
-                action = message_data.get("action", "view")
-
-                if action == "create":
-                    plan = safety_planner.create_new_plan()
-                    await manager.send_message(session_id, {
-                        "type": "safety_plan",
-                        "action": "created",
-                        "plan": plan.model_dump(),
-                        "timestamp": datetime.now().isoformat()
-                    })
-
-                elif action == "export":
-                    plan_text = safety_planner.export_to_text()
-                    await manager.send_message(session_id, {
-                        "type": "safety_plan",
-                        "action": "export",
-                        "plan_text": plan_text,
-                        "timestamp": datetime.now().isoformat()
-                    })
-
-                elif action == "summary":
-                    summary = safety_planner.get_plan_summary()
-                    await manager.send_message(session_id, {
-                        "type": "safety_plan",
-                        "action": "summary",
-                        "summary": summary,
-                        "timestamp": datetime.now().isoformat()
-                    })
-
-            elif message_type == "clear_history":
-                # Clear conversation history for privacy
-                ai_engine.clear_history()
-                await manager.send_message(session_id, {
-                    "type": "system",
-                    "message": "Conversation history cleared for your privacy.",
-                    "timestamp": datetime.now().isoformat()
-                })
+                # Crisis voice output (always speak crisis messages if voice available)
+                if response["is_crisis"] and VOICE_AVAILABLE:
+                    get_voice_cortex().speak_crisis(CRISIS_VOICE_TEXT)
 
-            elif message_type == "toggle_voice":
-                # Toggle voice output
-                if VOICE_AVAILABLE:
-                    current_voice = session.get("voice_enabled", False)
-                    session["voice_enabled"] = not current_voice
-                    new_status = "enabled" if session["voice_enabled"] else "disabled"
-
-                    await manager.send_message(session_id, {
-                        "type": "system",
-                        "message": f"Voice output {new_status}.",
-                        "voice_enabled": session["voice_enabled"],
-                        "timestamp": datetime.now().isoformat()
-                    })
-
-                    # Speak confirmation if voice just enabled
-                    if session["voice_enabled"] and session.get("multimodal_processor"):
-                        voice_cortex = get_voice_cortex()
-                        voice_cortex.speak("Voice output is now enabled. I can speak my responses to you.")
-                else:
-                    await manager.send_message(session_id, {
-                        "type": "system",
-                        "message": "Voice output is not available on this system.",
-                        "voice_available": False,
-                        "timestamp": datetime.now().isoformat()
-                    })
+            else:
+                handler = CHAT_HANDLERS.get(message_type)
+                if handler is not None:
+                    await handler(session, client_message)
 
     except WebSocketDisconnect:
-        manager.disconnect(session_id)
-    except Exception as e:
-        print(f"WebSocket error: {e}")
-        manager.disconnect(session_id)
+        await manager.disconnect(session_id)
+    except Exception:
+        logger.exception("WebSocket error")
+        await manager.disconnect(session_id)
 
 
 @app.websocket("/ws/behavior_capture")
 async def websocket_behavior_capture(websocket: WebSocket):
     """WebSocket endpoint for behavior capture and danger assessment"""
     await websocket.accept()
+    # Cortex and audio callbacks run on worker threads and hop back through this loop
+    loop = asyncio.get_running_loop()
 
     # Initialize components if available
     cortex = get_cortex() if CORTEX_AVAILABLE else None
@@ -495,18 +1291,21 @@ async def websocket_behavior_capture(websocket: WebSocket):
         if resource_db:
             cortex.register_module("resources", resource_db)
 
+    # Replies mirror the framing of the client's last message
+    binary = False
+
     try:
         # Send initial status
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "status",
             "cortex_available": CORTEX_AVAILABLE,
             "voice_available": VOICE_AVAILABLE,
             "message": "Behavior capture system ready"
-        })
+        }, binary)
 
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data, binary = await receive_message(websocket)
             message_type = data.get("type", "")
 
             if message_type == "analyze_behavior":
@@ -515,18 +1314,17 @@ async def websocket_behavior_capture(websocket: WebSocket):
 
                 if not CORTEX_AVAILABLE or not behavioral_capture:
                     # Fallback response
-                    await websocket.send_json({
+                    await send_message(websocket, {
                         "type": "danger_assessment",
                         "level": "SAFE",
                         "confidence": 0.5,
                         "patterns": [],
                         "message": "Cortex system not available - limited analysis"
-                    })
+                    }, binary)
                     continue
 
                 # Submit to cortex for processing
-                import time
-                request_id = f"behavior_analysis_{time.time()}"
+                request_id = f"behavior_analysis_{time.monotonic_ns()}"
 
                 # Define callback for cortex response
                 async def send_response(response):
@@ -537,26 +1335,26 @@ async def websocket_behavior_capture(websocket: WebSocket):
                     empathy = response.data.get("empathy", {})
 
                     # Send danger assessment
-                    await websocket.send_json({
+                    await send_message(websocket, {
                         "type": "danger_assessment",
                         "level": danger_level,
                         "confidence": confidence,
                         "patterns": patterns
-                    })
+                    }, binary)
 
                     # Send empathy response
                     if empathy:
-                        await websocket.send_json({
+                        await send_message(websocket, {
                             "type": "empathy_response",
                             "response": empathy
-                        })
+                        }, binary)
 
                     # Trigger crisis if needed
                     if danger_level in ["CRITICAL", "IMMEDIATE"]:
-                        await websocket.send_json({
+                        await send_message(websocket, {
                             "type": "crisis_detected",
                             "level": danger_level
-                        })
+                        }, binary)
 
                 # Submit request to cortex
                 cortex.submit_request(
@@ -564,57 +1362,49 @@ async def websocket_behavior_capture(websocket: WebSocket):
                     priority=CortexPriority.NORMAL,
                     mode=CortexMode.EMOTIONAL_SUPPORT,
                     content={"text": text},
-                    callback=lambda r: asyncio.create_task(send_response(r))
+                    callback=lambda r: send_threadsafe(loop, send_response(r))
                 )
 
             elif message_type == "crisis":
                 # Immediate crisis intervention
                 if cortex and CORTEX_AVAILABLE:
-                    import time
                     cortex.submit_request(
-                        request_id=f"crisis_{time.time()}",
+                        request_id=f"crisis_{time.monotonic_ns()}",
                         priority=CortexPriority.CRISIS,
                         mode=CortexMode.CRISIS,
                         content={"text": "User triggered emergency", "context": {}}
                     )
 
                 # Always send crisis resources
-                crisis_resources = resource_db.get_crisis_resources()
-                await websocket.send_json({
-                    "type": "crisis_resources",
-                    "resources": [r.model_dump() for r in crisis_resources]
-                })
+                await send_encoded(websocket, crisis_capture_message(), binary)
 
                 # Voice crisis response
                 if voice_cortex:
-                    voice_cortex.speak_crisis(
-                        "I'm very concerned about your safety. "
-                        "If you're in immediate danger, call 911. "
-                        "The National Domestic Violence Hotline is 1-800-799-7233."
-                    )
+                    voice_cortex.speak_crisis(CRISIS_CAPTURE_VOICE_TEXT)
 
             elif message_type == "start_audio_monitor":
                 # Start audio danger monitoring
                 if CORTEX_AVAILABLE:
                     try:
-                        from .audio_safety_system import get_audio_safety_system
+                        if not AUDIO_AVAILABLE:
+                            raise RuntimeError("audio safety system dependencies are not installed")
                         audio_system = get_audio_safety_system()
 
                         # Define callbacks
                         def on_danger(assessment):
-                            asyncio.create_task(websocket.send_json({
+                            send_threadsafe(loop, send_message(websocket, {
                                 "type": "audio_danger",
                                 "level": assessment.danger_level.name,
                                 "confidence": assessment.confidence,
                                 "patterns": assessment.patterns_detected
-                            }))
+                            }, binary))
 
                         def on_crisis(assessment):
-                            asyncio.create_task(websocket.send_json({
+                            send_threadsafe(loop, send_message(websocket, {
                                 "type": "crisis_detected",
                                 "level": assessment.danger_level.name,
                                 "source": "audio"
-                            }))
+                            }, binary))
 
                         # Start monitoring
                         success = audio_system.start_monitoring(
@@ -622,40 +1412,45 @@ async def websocket_behavior_capture(websocket: WebSocket):
                             crisis_callback=on_crisis
                         )
 
-                        await websocket.send_json({
+                        await send_message(websocket, {
                             "type": "audio_monitor_status",
                             "active": success,
                             "message": "Audio monitoring started" if success else "Failed to start audio monitoring"
-                        })
+                        }, binary)
 
                     except Exception as e:
-                        await websocket.send_json({
+                        await send_message(websocket, {
                             "type": "audio_monitor_status",
                             "active": False,
                             "message": f"Audio monitoring unavailable: {str(e)}"
-                        })
+                        }, binary)
 
             elif message_type == "stop_audio_monitor":
                 # Stop audio monitoring
-                try:
-                    from .audio_safety_system import get_audio_safety_system
-                    audio_system = get_audio_safety_system()
-                    audio_system.stop_monitoring()
-
-                    await websocket.send_json({
-                        "type": "audio_monitor_status",
-                        "active": False,
-                        "message": "Audio monitoring stopped"
-                    })
-                except Exception:
-                    pass
+                if AUDIO_AVAILABLE:
+                    try:
+                        audio_system = get_audio_safety_system()
+                        audio_system.stop_monitoring()
+
+                        await send_message(websocket, {
+                            "type": "audio_monitor_status",
+                            "active": False,
+                            "message": "Audio monitoring stopped"
+                        }, binary)
+                    except Exception:
+                        pass
 
     except WebSocketDisconnect:
-        print("Behavior capture WebSocket disconnected")
-    except Exception as e:
-        print(f"Behavior capture WebSocket error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.info("Behavior capture WebSocket disconnected")
+    except Exception:
+        logger.exception("Behavior capture WebSocket error")
+
+
+@lru_cache(maxsize=1)
+def html_interface_variants() -> Tuple[Dict[str, bytes], str]:
+    """The inline interface encoded and precompressed once, with its ETag"""
+    content = get_html_interface().encode("utf-8")
+    return compress_variants(content), make_etag(content)
 
 
 def get_html_interface() -> str:
@@ -955,6 +1750,7 @@ def get_html_interface() -> str:
             const wsUrl = `${protocol}//${window.location.host}/ws/${sessionId}`;
 
             ws = new WebSocket(wsUrl);
+            ws.binaryType = 'arraybuffer';
 
             ws.onopen = function() {
                 document.getElementById('status').textContent = 'Connected securely';
@@ -962,8 +1758,15 @@ def get_html_interface() -> str:
             };
 
             ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
-                handleIncomingMessage(data);
+                const data = typeof event.data === 'string'
+                    ? JSON.parse(event.data)
+                    : unpackFrame(event.data);
+                // Messages from one turn can arrive together in a batch frame
+                if (data.type === 'batch') {
+                    data.batch.forEach(function(item) { handleIncomingMessage(item); });
+                } else {
+                    handleIncomingMessage(data);
+                }
             };
 
             ws.onclose = function() {
@@ -978,37 +1781,194 @@ def get_html_interface() -> str:
             };
         }
 
-        function handleIncomingMessage(data) {
+        // Windowed message list. Every message element stays in messageNodes,
+        // but only those near the viewport are attached to #messages, between
+        // two spacers sized from measured (or estimated) row heights, so a
+        // long session keeps a bounded number of nodes in the DOM.
+        const ROW_BUFFER = 10;
+        const ESTIMATED_ROW_HEIGHT = 80;
+        const ROW_GAP = 15;  // .message margin-bottom
+        const messageNodes = [];
+        const rowHeights = [];
+        const topSpacer = document.createElement('div');
+        const bottomSpacer = document.createElement('div');
+        let windowStart = 0;
+        let windowEnd = 0;
+        let windowFrame = 0;
+        let stickToBottom = false;
+
+        const rowObserver = typeof ResizeObserver !== 'undefined'
+            ? new ResizeObserver(function(entries) {
+                const messagesDiv = document.getElementById('messages');
+                const atBottom = messagesDiv.scrollHeight - messagesDiv.scrollTop - messagesDiv.clientHeight < 2 * ROW_GAP;
+                entries.forEach(function(entry) {
+                    rowHeights[entry.target.rowIndex] = entry.target.offsetHeight + ROW_GAP;
+                });
+                scheduleWindow(atBottom);
+            })
+            : null;
+
+        function rowHeight(index) {
+            return rowHeights[index] || ESTIMATED_ROW_HEIGHT;
+        }
+
+        function scheduleWindow(toBottom) {
+            stickToBottom = stickToBottom || toBottom;
+            if (!windowFrame) {
+                windowFrame = requestAnimationFrame(renderWindow);
+            }
+        }
+
+        function renderWindow() {
+            windowFrame = 0;
             const messagesDiv = document.getElementById('messages');
+            const count = messageNodes.length;
+            let total = 0;
+            for (let i = 0; i < count; i++) {
+                total += rowHeight(i);
+            }
+            const viewTop = stickToBottom
+                ? Math.max(0, total - messagesDiv.clientHeight)
+                : messagesDiv.scrollTop;
+            const viewBottom = viewTop + messagesDiv.clientHeight;
+
+            // First and last rows intersecting the viewport
+            let first = 0;
+            let offset = 0;
+            while (first < count - 1 && offset + rowHeight(first) <= viewTop) {
+                offset += rowHeight(first);
+                first++;
+            }
+            let last = first;
+            while (last < count && offset < viewBottom) {
+                offset += rowHeight(last);
+                last++;
+            }
+            const start = Math.max(0, first - ROW_BUFFER);
+            const end = Math.min(count, last + ROW_BUFFER);
+
+            if (start !== windowStart || end !== windowEnd || topSpacer.parentNode !== messagesDiv) {
+                for (let i = windowStart; i < windowEnd; i++) {
+                    if (i < start || i >= end) {
+                        // Don't replay the fade-in when scrolled back into view
+                        messageNodes[i].style.animation = 'none';
+                        if (rowObserver) rowObserver.unobserve(messageNodes[i]);
+                    }
+                }
+                const rows = messageNodes.slice(start, end);
+                messagesDiv.replaceChildren(topSpacer, ...rows, bottomSpacer);
+                rows.forEach(function(node, i) {
+                    if (rowObserver) {
+                        rowObserver.observe(node);
+                    } else if (!rowHeights[start + i]) {
+                        rowHeights[start + i] = node.offsetHeight + ROW_GAP;
+                    }
+                });
+                windowStart = start;
+                windowEnd = end;
+            }
+
+            let above = 0;
+            for (let i = 0; i < start; i++) {
+                above += rowHeight(i);
+            }
+            let below = 0;
+            for (let i = end; i < count; i++) {
+                below += rowHeight(i);
+            }
+            topSpacer.style.height = above + 'px';
+            bottomSpacer.style.height = below + 'px';
+
+            if (stickToBottom) {
+                messagesDiv.scrollTop = messagesDiv.scrollHeight;
+                stickToBottom = false;
+            }
+        }
+
+        function appendMessage(node) {
+            node.rowIndex = messageNodes.length;
+            messageNodes.push(node);
+            scheduleWindow(true);
+        }
+
+        (function initMessageWindow() {
+            const messagesDiv = document.getElementById('messages');
+            Array.from(messagesDiv.children).forEach(appendMessage);
+            messagesDiv.addEventListener('scroll', function() {
+                scheduleWindow(false);
+            });
+        })();
+
+        // Assistant reply currently being streamed in, if any
+        let streamingDiv = null;
+
+        function textDiv(className, text) {
+            const div = document.createElement('div');
+            if (className) div.className = className;
+            div.textContent = text;
+            return div;
+        }
+
+        function handleIncomingMessage(data) {
+            if (data.type === 'assistant_delta') {
+                if (!streamingDiv) {
+                    streamingDiv = document.createElement('div');
+                    streamingDiv.className = 'message assistant';
+                    streamingDiv.appendChild(document.createElement('div'));
+                    appendMessage(streamingDiv);
+                }
+                streamingDiv.firstChild.textContent += data.delta;
+                scheduleWindow(true);
+                return;
+            }
+
+            if (data.type === 'assistant_done') {
+                data.type = 'assistant';
+            }
 
             if (data.type === 'assistant' || data.type === 'system') {
-                const messageDiv = document.createElement('div');
+                const messageDiv = (data.type === 'assistant' && streamingDiv) || document.createElement('div');
+                streamingDiv = null;
                 messageDiv.className = `message ${data.type}`;
 
                 if (data.is_crisis) {
                     messageDiv.classList.add('crisis');
-                    document.getElementById('emergencyBanner').classList.add('show');
+                    requestAnimationFrame(function() {
+                        document.getElementById('emergencyBanner').classList.add('show');
+                    });
                 }
 
-                let content = '';
+                // Build the parts off-document and attach them in one append
+                const parts = document.createDocumentFragment();
 
                 if (data.mode && data.type === 'assistant') {
-                    content += `<div class="mode-indicator mode-${data.mode}">${data.mode.replace(/_/g, ' ').toUpperCase()}</div>`;
+                    parts.appendChild(textDiv(`mode-indicator mode-${data.mode}`, data.mode.replace(/_/g, ' ').toUpperCase()));
                 }
 
-                content += `<div>${escapeHtml(data.message)}</div>`;
+                parts.appendChild(textDiv('', data.message));
+
+                if (data.truncated) {
+                    const notice = textDiv('', 'This reply was cut off. Please send your message again.');
+                    notice.style.cssText = 'margin-top: 6px; font-size: 12px; font-style: italic;';
+                    parts.appendChild(notice);
+                }
 
                 if (data.safety_reminder) {
-                    content += `<div style="margin-top: 10px; font-size: 12px; opacity: 0.8;">💡 ${escapeHtml(data.safety_reminder)}</div>`;
+                    const reminder = textDiv('', '💡 ' + data.safety_reminder);
+                    reminder.style.cssText = 'margin-top: 10px; font-size: 12px; opacity: 0.8;';
+                    parts.appendChild(reminder);
                 }
 
                 if (data.timestamp) {
-                    content += `<div class="timestamp">${new Date(data.timestamp).toLocaleTimeString()}</div>`;
+                    parts.appendChild(textDiv('timestamp', new Date(data.timestamp).toLocaleTimeString()));
                 }
 
-                messageDiv.innerHTML = content;
-                messagesDiv.appendChild(messageDiv);
-                messagesDiv.scrollTop = messagesDiv.scrollHeight;
+                messageDiv.replaceChildren(parts);
+                if (messageDiv.rowIndex === undefined) {
+                    appendMessage(messageDiv);
+                } else {
+                    scheduleWindow(true);
+                }
             }
 
             if (data.type === 'resources') {
@@ -1024,23 +1984,46 @@ def get_html_interface() -> str:
 
             if (message && ws && ws.readyState === WebSocket.OPEN) {
                 // Display user message
-                const messagesDiv = document.getElementById('messages');
                 const messageDiv = document.createElement('div');
                 messageDiv.className = 'message user';
-                messageDiv.innerHTML = `<div>${escapeHtml(message)}</div><div class="timestamp">${new Date().toLocaleTimeString()}</div>`;
-                messagesDiv.appendChild(messageDiv);
-                messagesDiv.scrollTop = messagesDiv.scrollHeight;
+                messageDiv.append(textDiv('', message), textDiv('timestamp', new Date().toLocaleTimeString()));
+                appendMessage(messageDiv);
 
                 // Send to server
-                ws.send(JSON.stringify({
+                sendFrame({
                     type: 'chat',
-                    message: message
-                }));
+                    message: message,
+                    stream: true
+                });
 
                 input.value = '';
             }
         }
 
+        // Binary msgpack framing when a msgpack codec (msgpack-lite) is loaded,
+        // JSON text otherwise. Frame layout: [1 byte: tag length][type tag][msgpack body]
+        const useBinary = typeof msgpack !== 'undefined';
+        const tagEncoder = new TextEncoder();
+
+        function sendFrame(payload) {
+            if (!useBinary) {
+                ws.send(JSON.stringify(payload));
+                return;
+            }
+            const tag = tagEncoder.encode(payload.type || '');
+            const body = msgpack.encode(payload);
+            const frame = new Uint8Array(1 + tag.length + body.length);
+            frame[0] = tag.length;
+            frame.set(tag, 1);
+            frame.set(body, 1 + tag.length);
+            ws.send(frame);
+        }
+
+        function unpackFrame(buffer) {
+            const bytes = new Uint8Array(buffer);
+            return msgpack.decode(bytes.subarray(1 + bytes[0]));
+        }
+
         function sendQuickMessage(message) {
             document.getElementById('messageInput').value = message;
             sendMessage();
@@ -1057,12 +2040,6 @@ def get_html_interface() -> str:
             window.location.replace('https://www.google.com');
         }
 
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
-
         // ESC key for quick exit
         document.addEventListener('keydown', function(event) {
             if (event.key === 'Escape') {
@@ -1081,10 +2058,24 @@ def get_html_interface() -> str:
 
 
 if __name__ == "__main__":
+    # Equivalent CLI:
+    #   uvicorn src.main:app --loop uvloop --http httptools --ws websockets \
+    #       --ws-per-message-deflate false --workers $(nproc) --backlog 4096
+    # With several workers, put a proxy in front that is sticky on the
+    # /ws/{session_id} path (e.g. nginx "hash $request_uri consistent") and set
+    # REDIS_URL so workers record which of them holds each session.
     import uvicorn
     uvicorn.run(
         "src.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
+        ws="websockets",
+        # Chat frames are small; per-message deflate costs more CPU than it saves
+        ws_per_message_deflate=False,
+        # Sessions live on the worker holding their WebSocket, so workers scale freely
+        workers=None if settings.debug else (os.cpu_count() or 1),
+        backlog=4096
     )